@@ -53,6 +53,8 @@ State data includes the following:
 
   - `RO`: reliability organization name(s)
 
+  - `FIPSCODE`: state FIPS code as an integer, e.g., `6`
+
 County data includes the following:
 
   - `ST`: state abbreviation, e.g., `"CA"`
@@ -69,6 +71,12 @@ County data includes the following:
 
   - `GEOHASH`: county centroid geohash, e.g., `9q9q1v`
 
+  - `FIPSCODE`: county FIPS code as an integer, e.g., `6001`
+
+  - `STATECODE`: state FIPS code as an integer, e.g., `6`
+
+  - `TIMEZONE`: county IANA time zone name, e.g., `"America/Los_Angeles"`
+
 Command line examples
 ---------------------
 
@@ -78,9 +86,9 @@ Command line examples
   
     Outputs
 
-                 STATE FIPS  TZOFFSET  DST SYSTEM    RO
-        ST                                             
-        CA  California   06      -8.0    1   WECC  WECC
+                 STATE FIPS  TZOFFSET  DST SYSTEM    RO  FIPSCODE
+        ST                                                       
+        CA  California   06      -8.0    1   WECC  WECC         6
 
   - Get Alameda County CA data
 
@@ -88,9 +96,9 @@ Command line examples
 
     Outputs
 
-                     FIPS        LAT         LON GEOHASH  TZOFFSET  DST SYSTEM    RO
-        ST COUNTY                                                                   
-        CA Alameda  06001  37.647139 -121.912488  9q9q1v      -8.0    1   WECC  WECC
+                     FIPS        LAT         LON GEOHASH  TZOFFSET  DST SYSTEM    RO  FIPSCODE  STATECODE             TIMEZONE
+        ST COUNTY                                                                                                             
+        CA Alameda  06001  37.647139 -121.912488  9q9q1v      -8.0    1   WECC  WECC      6001          6  America/Los_Angeles
 
 Python examples
 ---------------
@@ -127,24 +135,28 @@ Python examples
 
         06
 
-  - Get list of states names indexed by state abbrevation
+  - Get list of states indexed by state abbrevation
 
         from fips.states import States
         print(States().set_index("ST"))
 
   Outputs
 
-                           STATE
-        ST                                     
-        AL               Alabama
-        AK                Alaska
-        AZ               Arizona
-        AR              Arkansas
-        ...
-        WA            Washington
-        WV         West Virginia
-        WI             Wisconsin
-        WY               Wyoming
+                    STATE FIPS  TZOFFSET  DST SYSTEM       RO  FIPSCODE
+        ST                                                             
+        AL        Alabama   01      -6.0    1   EAST     SERC         1
+        AK         Alaska   02      -9.0    1     AK     NERC         2
+        AZ        Arizona   04      -7.0    0   WECC     WECC         4
+        AR       Arkansas   05      -6.0    1   EAST     SERC         5
+        CA     California   06      -8.0    1   WECC     WECC         6
+        ..            ...  ...       ...  ...    ...      ...       ...
+        VA       Virginia   51      -5.0    1   EAST  SERC|RF        51
+        WA     Washington   53      -8.0    1   WECC     WECC        53
+        WV  West Virginia   54      -5.0    1   EAST       RF        54
+        WI      Wisconsin   55      -6.0    1   EAST   MRO|RF        55
+        WY        Wyoming   56      -7.0    1   WECC     WECC        56
+
+        [51 rows x 7 columns]
 
   - Get Alameda County's GEOHASH code
 
@@ -155,28 +167,28 @@ Python examples
 
         9q9q1v
 
-  - Get counties geographic data by state and county name
+  - Get list of counties indexed by state and county name
 
         from fips.counties import Counties
-        print(Counties().set_index(["ST","COUNTY"])["LAT","LON","GEOHASH"])
+        print(Counties().set_index(["ST","COUNTY"]))
 
     Outputs
 
-                             LAT         LON GEOHASH
-        ST COUNTY                                          
-        AL Autauga     32.532237  -86.646440  djf3h6
-           Baldwin     30.659218  -87.746067  dj3w7m
-           Barbour     31.870253  -85.405104  djem29
-           Bibb        33.015893  -87.127148  djf5c6
-           Blount      33.977358  -86.566440  dn43q1
-        ...              ...        ...         ...     ...
-        WY Sweetwater  41.660328 -108.875677  9x6t42
-           Teton       44.048662 -110.426087  9xc6x4
-           Uinta       41.284726 -110.558947  9x36u5
-           Washakie    43.878831 -107.669052  9xg3tg
-           Weston      43.846213 -104.570020  9xv9km
-
-        [3142 rows x 4 columns]
+                        FIPS        LAT         LON GEOHASH  TZOFFSET  DST SYSTEM    RO  FIPSCODE  STATECODE         TIMEZONE
+        ST COUNTY                                                                                                            
+        AL Autauga     01001  32.532237  -86.646440  djf3h6      -6.0    1   EAST  SERC      1001          1  America/Chicago
+           Baldwin     01003  30.659218  -87.746067  dj3w7m      -6.0    1   EAST  SERC      1003          1  America/Chicago
+           Barbour     01005  31.870253  -85.405104  djem29      -6.0    1   EAST  SERC      1005          1  America/Chicago
+           Bibb        01007  33.015893  -87.127148  djf5c6      -6.0    1   EAST  SERC      1007          1  America/Chicago
+           Blount      01009  33.977358  -86.566440  dn43q1      -6.0    1   EAST  SERC      1009          1  America/Chicago
+        ...              ...        ...         ...     ...       ...  ...    ...   ...       ...        ...              ...
+        WY Sweetwater  56037  41.660328 -108.875677  9x6t42      -7.0    1   WECC  WECC     56037         56   America/Denver
+           Teton       56039  44.048662 -110.426087  9xc6x4      -7.0    1   WECC  WECC     56039         56   America/Denver
+           Uinta       56041  41.284726 -110.558947  9x36u5      -7.0    1   WECC  WECC     56041         56   America/Denver
+           Washakie    56043  43.878831 -107.669052  9xg3tg      -7.0    1   WECC  WECC     56043         56   America/Denver
+           Weston      56045  43.846213 -104.570020  9xv9km      -7.0    1   WECC  WECC     56045         56   America/Denver
+
+        [3142 rows x 11 columns]
 
 Package information
 -------------------
@@ -193,7 +205,40 @@ Package information
 
     - [Pandas](https://pandas.pydata.org/docs/)
 
+    - [NumPy](https://numpy.org/doc/)
+
+  Note that `State` and `County` only require the Python standard library, so
+  `pandas` and `numpy` are only imported when data frames or vectorized
+  functions are used.
+
+  - Cache folder: derived arrays, such as `Counties.distance_matrix()`, are
+    saved in the folder given by the `FIPS_CACHE_DIR` environment variable
+    (default is `~/.cache/fips`).
+
 ---
-"""
-from fips.states import States, State
-from fips.counties import Counties, County
+""" # pylint: disable=line-too-long
+
+import importlib
+
+__all__ = ["States","State","Counties","County"] # pylint: disable=undefined-all-variable
+
+_LAZY = {
+    "States":"fips.states",
+    "State":"fips.states",
+    "Counties":"fips.counties",
+    "County":"fips.counties",
+    }
+"""Modules providing the package attributes, which are imported on first use"""
+
+_MODULES = ("cli","counties","geohash","localtime","sparse","spatial","states")
+"""Package modules, which are imported on first use"""
+
+def __getattr__(name):
+    if name in _LAZY:
+        return getattr(importlib.import_module(_LAZY[name]),name)
+    if name in _MODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_MODULES))
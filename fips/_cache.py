@@ -0,0 +1,84 @@
+"""Cache of derived counties data arrays
+
+Arrays derived from the counties data that are too costly to recompute in
+every process (e.g., the county distance matrix) are saved as `.npy` files
+in a cache folder and memory mapped read-only on load, so that processes
+using the same array share its pages. The cache folder is given by the
+`FIPS_CACHE_DIR` environment variable (default is `fips` in the user cache
+folder) and each cache version and counties data version uses its own
+subfolder, so arrays never need to be invalidated.
+"""
+
+import os
+import warnings
+
+import numpy as np
+
+from fips.counties import _data_digest
+
+CACHE_VERSION = 1
+"""Cache file format version"""
+
+def cache_dir() -> str:
+    """Get the versioned cache folder
+
+    Returns
+    -------
+
+      - `str`: cache folder name for the current cache and counties data
+        versions
+    """
+    root = os.environ.get("FIPS_CACHE_DIR")
+    if not root:
+        root = os.path.join(os.environ.get("XDG_CACHE_HOME") or
+            os.path.join(os.path.expanduser("~"),".cache"),"fips")
+    return os.path.join(root,f"v{CACHE_VERSION}-{_data_digest().hex()}")
+
+def cached_array(name:str,shape:tuple[int,...],dtype:str,fill) -> np.ndarray:
+    """Get a cached array, computing it if it is not cached yet
+
+    The array is computed by writing into a new `.npy` file that is renamed
+    into the cache folder when complete, so concurrent processes never load
+    an incomplete array. If the cache folder is not writable, a warning is
+    issued and the array is computed in memory.
+
+    Arguments
+    ---------
+
+      - `name`: array file name, without the `.npy` extension
+
+      - `shape`: array shape
+
+      - `dtype`: array type
+
+      - `fill`: function that computes the array values in place
+
+    Returns
+    -------
+
+      - `np.ndarray`: read-only array, memory mapped if cached
+    """
+    pathname = os.path.join(cache_dir(),f"{name}.npy")
+    if not os.path.exists(pathname):
+        tmpname = f"{pathname}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(pathname),exist_ok=True)
+            array = np.lib.format.open_memmap(tmpname,mode="w+",dtype=dtype,shape=shape)
+        except OSError as err:
+            warnings.warn(f"unable to cache {name} ({err}), computing in memory instead")
+            array = np.empty(shape,dtype=dtype)
+            fill(array)
+            array.flags.writeable = False
+            return array
+        try:
+            fill(array)
+            array.flush()
+            del array
+            os.replace(tmpname,pathname)
+        finally:
+            if os.path.exists(tmpname):
+                os.remove(tmpname)
+    array = np.load(pathname,mmap_mode="r")
+    if array.shape != tuple(shape) or array.dtype != np.dtype(dtype):
+        raise ValueError(f"cached array {pathname} is not valid")
+    return array
@@ -0,0 +1,1409 @@
+"""US counties data frame
+
+See `fips.counties` for details. This module is loaded only when the counties
+data frame is used because it requires `pandas`.
+"""
+
+import collections
+import concurrent.futures
+import functools
+import threading
+import zoneinfo
+
+import numpy as np
+import pandas as pd
+
+from fips.counties import County, _columns, _SCHEMA
+from fips.spatial import KDTree, to_xyz, chord_to_km, km_to_chord, haversine
+from fips import localtime
+from fips.sparse import CSRMatrix
+from fips._cache import cached_array
+
+# pylint: disable=too-many-lines
+
+RASTER_EXTENTS = {
+    "CONUS":(24.0,-125.0,50.0,-66.0),
+    "AK":(51.0,-180.0,72.0,-129.0),
+    "HI":(18.5,-160.5,22.5,-154.5),
+    }
+"""Nearest county raster extents (south, west, north, east) in degrees"""
+
+MATCH_COLUMNS = ("ST","SYSTEM","RO","TZOFFSET","DST","TIMEZONE")
+"""Columns that can be matched by `Counties.match()`"""
+
+CacheInfo = collections.namedtuple("CacheInfo",["hits","misses","maxsize","currsize"])
+"""Results cache statistics (see `Counties.cache_info()`)"""
+
+class Counties(pd.DataFrame):
+    # pylint: disable=too-many-public-methods
+    """US counties dataframe
+
+    Columns
+    -------
+
+      - `ST`: state abbreviation
+
+      - `FIPS`: county FIPS code
+
+      - `COUNTY`: county/parish/burrough name
+    
+      - `LAT`: county centroid latitude
+
+      - `LON`: county centroid longitude
+
+      - `GEOHASH`: county centroid geohash
+
+      - `TZOFFSET`: state timezone offset
+
+      - `DST`: flag to indicate whether summer time is observed
+
+      - `SYSTEM`: system interconnection name
+
+      - `RO`: reliability organization name
+
+      - `FIPSCODE`: county FIPS code as an `int32` (see `encode_fips()`)
+
+      - `STATECODE`: state FIPS code as an `int8`
+
+      - `TIMEZONE`: IANA time zone name, e.g., `"America/Los_Angeles"`
+
+    Caveat
+    ------
+
+      - Some counties located along timezone boundaries may be split across
+        two timezones. In such cases, the timezone selected covers the
+        majority of the county's land area.
+    """
+    def __init__(self,
+        state:str=None,
+        use_index:str|list[str]=None,
+        selection:list=None,
+        set_index:str|list[str]=None
+        ):
+        """Construct a data frame of US counties
+
+        Arguments
+        ---------
+
+          - `state`: state abbreviation, or list of state abbreviations
+
+          - `use_index`: use the specified column(s) as the index
+
+          - `selection`: row selection based on `use_index` 
+
+          - `set_index`: index to to set on data frame after row selection
+
+        When the results cache is enabled (see `set_cache()`), frames built
+        with the same arguments are reused. Each caller gets its own frame,
+        which shares the cached data until it is modified (copy-on-write in
+        pandas 3 and later, copies otherwise).
+        """
+        key = _RESULTS.key(state,use_index,selection,set_index)
+        data = _RESULTS.get(key)
+        if data is not None:
+            super().__init__(_private(data))
+            return
+
+        data = _master()
+        if not state is None:
+            ranges = _state_ranges()
+            try:
+                slices = [slice(*ranges[x]) for x in ([state] if isinstance(state,str) else state)]
+            except KeyError as err:
+                raise KeyError(f"{err.args[0]!r} is not a valid state abbreviation") from None
+            if len(slices) == 1:
+                data = data.iloc[slices[0]].reset_index(drop=True)
+            else:
+                data = pd.concat([data.iloc[x] for x in slices],ignore_index=True)
+        if use_index:
+            data = data.set_index(use_index)
+        if selection:
+            data = data.loc[selection]
+        if set_index:
+            data = data.reset_index().set_index(set_index)
+        data = data.sort_index()
+        if key is not None:
+            _RESULTS.put(key,data)
+            data = _private(data)
+        super().__init__(data)
+
+    @staticmethod
+    def set_cache(maxsize:int=128):
+        """Enable or disable the results cache
+
+        The results cache keeps the most recently used frames built by
+        `Counties(...)`, which are reused when frames are built again with
+        the same arguments. The cache is disabled by default.
+
+        Arguments
+        ---------
+
+          - `maxsize`: maximum number of cached frames, or 0 to disable the
+            cache and clear it
+        """
+        _RESULTS.resize(maxsize)
+
+    @staticmethod
+    def cache_info() -> CacheInfo:
+        """Get the results cache statistics
+
+        Returns
+        -------
+
+          - `CacheInfo`: numbers of cache hits and misses, maximum number of
+            cached frames, and current number of cached frames
+        """
+        return _RESULTS.info()
+
+    @staticmethod
+    def cache_clear():
+        """Clear the results cache and its statistics"""
+        _RESULTS.clear()
+
+    @staticmethod
+    def lookup_many(
+        fips:list[str]|np.ndarray|pd.Series,
+        columns:list[str]=None,
+        ) -> dict[str,np.ma.MaskedArray]:
+        """Get county data for many county FIPS codes at once
+
+        Arguments
+        ---------
+
+          - `fips`: county FIPS codes (e.g., `["06001","06003"]`), or
+            integer county FIPS codes (e.g., `[6001,6003]`)
+
+          - `columns`: columns to get (default is all `County` data)
+
+        Returns
+        -------
+
+          - `dict[str,np.ma.MaskedArray]`: county data aligned with `fips`,
+            masked where the FIPS code is unknown
+        """
+        rows = _rows(fips)
+        mask = rows < 0
+        rows[mask] = 0
+        arrays = _arrays()
+        return {x:np.ma.MaskedArray(arrays[x].take(rows),mask=mask)
+            for x in (columns if columns else County.__slots__)}
+
+    @staticmethod
+    def utc_offset(
+        utc:np.ndarray|pd.Series,
+        fips:list[str]|np.ndarray|pd.Series,
+        ) -> np.ndarray:
+        """Get the county UTC offsets at UTC timestamps
+
+        Offsets are computed from the county `TZOFFSET` and `DST` data using
+        the US daylight saving time rules (see `fips.localtime`).
+
+        Arguments
+        ---------
+
+          - `utc`: UTC timestamps, broadcast against `fips`
+
+          - `fips`: county FIPS codes, or integer county FIPS codes
+
+        Returns
+        -------
+
+          - `np.ndarray`: UTC offsets (hours)
+        """
+        rows = _rows(fips,strict=True)
+        return localtime.utc_offset(utc,_arrays()["TZOFFSET"][rows],_arrays()["DST"][rows])
+
+    @staticmethod
+    def local_time(
+        utc:np.ndarray|pd.Series,
+        fips:list[str]|np.ndarray|pd.Series,
+        ) -> np.ndarray:
+        """Convert UTC timestamps to county local timestamps
+
+        Arguments
+        ---------
+
+          - `utc`: UTC timestamps, broadcast against `fips`
+
+          - `fips`: county FIPS codes, or integer county FIPS codes
+
+        Returns
+        -------
+
+          - `np.ndarray`: local timestamps, without time zone
+        """
+        rows = _rows(fips,strict=True)
+        return localtime.to_local(utc,_arrays()["TZOFFSET"][rows],_arrays()["DST"][rows])
+
+    @staticmethod
+    def rollup(
+        values:np.ndarray|pd.DataFrame,
+        level:str,
+        ) -> tuple[np.ndarray,np.ndarray]:
+        """Sum county values by state, interconnection, or reliability organization
+
+        The groups of counties are computed only once per process for each
+        level, so each rollup is a single segment reduction over rows.
+
+        Arguments
+        ---------
+
+          - `values`: county values as an array of shape `(counties,...)`
+            in master row order (e.g., counties by hours)
+
+          - `level`: grouping column (e.g., `"ST"`, `"SYSTEM"`, or `"RO"`)
+
+        Returns
+        -------
+
+          - `np.ndarray`: group names in sorted order
+
+          - `np.ndarray`: sums as an array of shape `(groups,...)` with the
+            type of `values.sum()` whatever the shape of `values`
+        """
+        values = np.asarray(values)
+        names,ids,order,starts = _group_ids(level)
+        if len(values) != len(ids):
+            raise ValueError(f"values has {len(values)} rows instead of {len(ids)}")
+        if values.dtype == bool:
+            values = values.astype(np.int64)
+        return names,np.add.reduceat(values if order is None else values[order],starts,axis=0)
+
+    @staticmethod
+    def aggregation_matrix(
+        level:str,
+        weights:str|dict[str,float]="equal",
+        ) -> tuple[np.ndarray,CSRMatrix]:
+        """Get the county to region aggregation matrix
+
+        Counties that belong to more than one region (e.g., `RO` values like
+        `"SERC|RF|MRO"`) are split among their regions according to the
+        weights. Matrices are computed only once per process for each level
+        and weights.
+
+        Arguments
+        ---------
+
+          - `level`: region column (e.g., `"SYSTEM"` or `"RO"`), with
+            multiple regions separated by `"|"`
+
+          - `weights`: `"equal"` to split counties equally among their
+            regions, `"full"` to include counties fully in each of their
+            regions, or relative weights of the regions, which are
+            normalized for each county
+
+        Returns
+        -------
+
+          - `np.ndarray`: region names in sorted order
+
+          - `CSRMatrix`: aggregation matrix of shape `(regions,counties)`
+            with counties in master row order, such that `matrix @ values`
+            sums values of shape `(counties,...)` by region
+        """
+        if isinstance(weights,dict):
+            weights = tuple(sorted(weights.items()))
+        elif weights not in ("equal","full"):
+            raise ValueError(f"{weights=} is not valid")
+        return _aggregation_matrix(level,weights)
+
+    @staticmethod
+    def in_ro(ro:str) -> pd.DataFrame:
+        """Get the counties in a reliability organization
+
+        Arguments
+        ---------
+
+          - `ro`: reliability organization name, e.g., `"MRO"`
+
+        Returns
+        -------
+
+          - `pd.DataFrame`: data of the counties whose `RO` includes the
+            organization, in master row order
+        """
+        try:
+            rows = _inverted_index("RO")[ro]
+        except KeyError:
+            raise KeyError(f"{ro=} is not a valid reliability organization") from None
+        return _master().iloc[rows].reset_index(drop=True)
+
+    @staticmethod
+    def in_ro_many(
+        fips:list[str]|np.ndarray|pd.Series,
+        ro:str|list[str]|np.ndarray,
+        ) -> np.ndarray:
+        """Test whether many counties are in reliability organizations
+
+        Arguments
+        ---------
+
+          - `fips`: county FIPS codes, or integer county FIPS codes
+
+          - `ro`: reliability organization names, broadcast against `fips`
+
+        Returns
+        -------
+
+          - `np.ndarray`: membership flags, which are false for unknown
+            organizations
+        """
+        names,membership = _membership("RO")
+        rows = _rows(fips,strict=True)
+        ro = np.asarray(ro,dtype=str)
+        columns = np.minimum(np.searchsorted(names,ro),len(names)-1)
+        known = names[columns] == ro
+        rows,columns,known = np.broadcast_arrays(rows,columns,known)
+        return membership[rows,columns] & known
+
+    @staticmethod
+    def ro_membership() -> tuple[np.ndarray,np.ndarray]:
+        """Get the reliability organization membership matrix
+
+        Returns
+        -------
+
+          - `np.ndarray`: reliability organization names in sorted order
+
+          - `np.ndarray`: read-only boolean array of shape
+            `(counties,organizations)` with counties in master row order
+        """
+        return _membership("RO")
+
+    @staticmethod
+    def match(**kwargs) -> pd.DataFrame:
+        """Get the counties matching column values
+
+        Matches are found using a bitmap of the counties for each value of
+        the `MATCH_COLUMNS`, which are built only once per process. `RO`
+        values match each of the county's reliability organizations.
+
+        Arguments
+        ---------
+
+          - `**kwargs`: column values, e.g., `SYSTEM="WECC"`, or lists of
+            column values, e.g., `TZOFFSET=[-8,-7]`. Counties must match all
+            the columns and any of the values of each column.
+
+        Returns
+        -------
+
+          - `pd.DataFrame`: data of the matching counties in master row
+            order
+        """
+        found = np.full((len(_master())+7)//8,0xFF,dtype=np.uint8)
+        for column,values in kwargs.items():
+            if column not in MATCH_COLUMNS:
+                raise TypeError(f"{column=} is not one of {MATCH_COLUMNS}")
+            bitmaps = _bitmaps(column)
+            matches = np.zeros_like(found)
+            if not isinstance(values,(list,tuple,set,np.ndarray,pd.Index,pd.Series)):
+                values = [values]
+            for value in values:
+                if value in bitmaps:
+                    matches |= bitmaps[value]
+            found &= matches
+        rows = np.flatnonzero(np.unpackbits(found,count=len(_master())))
+        return _master().iloc[rows].reset_index(drop=True)
+
+    @staticmethod
+    def zoneinfo(fips:str) -> zoneinfo.ZoneInfo:
+        """Get the time zone of a county
+
+        Arguments
+        ---------
+
+          - `fips`: county FIPS code
+
+        Returns
+        -------
+
+          - `zoneinfo.ZoneInfo`: county time zone, which is shared by all the
+            counties in the same `TIMEZONE`
+        """
+        return _zoneinfo(_arrays()["TIMEZONE"][_rows([fips],strict=True)[0]])
+
+    @staticmethod
+    def zone_local_time(
+        utc:np.ndarray|pd.Series,
+        fips:list[str]|np.ndarray|pd.Series,
+        ) -> np.ndarray:
+        """Convert UTC timestamps to county local timestamps using time zones
+
+        Unlike `local_time()`, which uses the county `TZOFFSET` and `DST`,
+        this uses the county `TIMEZONE`, including its history. Timestamps
+        are grouped by time zone and each group is converted at once.
+
+        Arguments
+        ---------
+
+          - `utc`: UTC timestamps, broadcast against `fips`
+
+          - `fips`: county FIPS codes, or integer county FIPS codes
+
+        Returns
+        -------
+
+          - `np.ndarray`: local timestamps, without time zone
+        """
+        rows = _rows(fips,strict=True)
+        utc = np.asarray(utc)
+        if not np.issubdtype(utc.dtype,np.datetime64) or \
+                np.datetime_data(utc.dtype)[0] in ("Y","M","W","D","h","m"):
+            utc = utc.astype("datetime64[s]")
+        utc,rows = np.broadcast_arrays(utc,rows)
+        result = np.empty(utc.shape,dtype=utc.dtype)
+        codes,names = _timezone_codes()
+        codes = codes[rows]
+        for code,name in enumerate(names):
+            found = codes == code
+            if found.any():
+                result[found] = pd.DatetimeIndex(utc[found]).tz_localize("UTC") \
+                    .tz_convert(_zoneinfo(name)).tz_localize(None).to_numpy()
+        return result
+
+    @staticmethod
+    def offset_calendar(first_year:int,last_year:int=None) -> tuple[np.ndarray,np.ndarray]:
+        """Get the hourly county UTC offsets for a range of years
+
+        Counties with the same `TZOFFSET` and `DST` have the same offsets, so
+        the offsets are computed and stored once for each such group of
+        counties, and memoized by year. The offsets of all the counties are
+        `offsets[groups]`, which has shape `(counties,hours)`.
+
+        Arguments
+        ---------
+
+          - `first_year`: first calendar year
+
+          - `last_year`: last calendar year (default is `first_year`)
+
+        Returns
+        -------
+
+          - `np.ndarray`: UTC offsets (hours) as a read-only `int8` array of
+            shape `(groups,hours)`, with hours starting at midnight UTC on
+            January 1 of the first year
+
+          - `np.ndarray`: group of each county in master row order
+        """
+        years = range(first_year,(first_year if last_year is None else last_year)+1)
+        if not years:
+            raise ValueError(f"{last_year=} is before {first_year=}")
+        if len(years) == 1:
+            offsets = _offset_year(first_year)
+        else:
+            offsets = np.concatenate([_offset_year(x) for x in years],axis=1)
+            offsets.flags.writeable = False
+        return offsets,_offset_groups()[1]
+
+    @staticmethod
+    def nearest(lat:float,lon:float,k:int=1) -> pd.DataFrame:
+        """Get the counties nearest to a location
+
+        Coordinates must be finite.
+
+        Arguments
+        ---------
+
+          - `lat`: latitude (degrees)
+
+          - `lon`: longitude (degrees)
+
+          - `k`: number of counties to get
+
+        Returns
+        -------
+
+          - `pd.DataFrame`: data of the `k` counties whose centroids are
+            nearest, with the great circle `DISTANCE` (km), in order of
+            increasing distance
+        """
+        _check_locations(lat,lon)
+        chord,rows = _tree().query(to_xyz(lat,lon),k)
+        data = _master().iloc[rows[0]].reset_index(drop=True)
+        data["DISTANCE"] = chord_to_km(chord[0])
+        return data
+
+    @staticmethod
+    def nearest_many(
+        lat:list[float]|np.ndarray,
+        lon:list[float]|np.ndarray,
+        k:int=1,
+        ) -> tuple[np.ndarray,np.ndarray]:
+        """Get the counties nearest to many locations at once
+
+        Coordinates must be finite.
+
+        Arguments
+        ---------
+
+          - `lat`: latitudes (degrees)
+
+          - `lon`: longitudes (degrees)
+
+          - `k`: number of counties to get for each location
+
+        Returns
+        -------
+
+          - `np.ndarray`: FIPS codes of the counties whose centroids are
+            nearest, as an array of shape `(n,)` if `k` is 1, otherwise of
+            shape `(n,k)` in order of increasing distance
+
+          - `np.ndarray`: great circle distances (km) of the counties, with
+            the same shape
+        """
+        _check_locations(lat,lon)
+        chord,rows = _tree().query(to_xyz(lat,lon),k)
+        if k == 1:
+            chord,rows = chord[:,0],rows[:,0]
+        return _arrays()["FIPS"][rows],chord_to_km(chord)
+
+    @staticmethod
+    def within_radius(lat:float,lon:float,km:float) -> pd.DataFrame:
+        """Get the counties within a distance of a location
+
+        Arguments
+        ---------
+
+          - `lat`: latitude (degrees)
+
+          - `lon`: longitude (degrees)
+
+          - `km`: great circle distance (km)
+
+        Returns
+        -------
+
+          - `pd.DataFrame`: data of the counties whose centroids are within
+            the distance, with the great circle `DISTANCE` (km), in order of
+            increasing distance
+        """
+        _,rows,chord = _tree().query_radius(to_xyz(lat,lon),km_to_chord(km))
+        order = np.argsort(chord,kind="stable")
+        data = _master().iloc[rows[order]].reset_index(drop=True)
+        data["DISTANCE"] = chord_to_km(chord[order])
+        return data
+
+    @staticmethod
+    def within_radius_many(
+        lat:list[float]|np.ndarray,
+        lon:list[float]|np.ndarray,
+        km:float|list[float]|np.ndarray,
+        ) -> tuple[np.ndarray,np.ndarray,np.ndarray]:
+        """Get the counties within a distance of many locations at once
+
+        Arguments
+        ---------
+
+          - `lat`: latitudes (degrees)
+
+          - `lon`: longitudes (degrees)
+
+          - `km`: great circle distance (km), for all locations or for each
+            one
+
+        Returns
+        -------
+
+          - `np.ndarray`: location index of each match, in increasing order
+
+          - `np.ndarray`: FIPS code of each matching county
+
+          - `np.ndarray`: great circle distance (km) of each matching county
+        """
+        queries,rows,chord = _tree().query_radius(to_xyz(lat,lon),km_to_chord(km))
+        return queries,_arrays()["FIPS"][rows],chord_to_km(chord)
+
+    @staticmethod
+    def within_bbox(south:float,west:float,north:float,east:float) -> pd.DataFrame:
+        """Get the counties within a latitude/longitude box
+
+        Arguments
+        ---------
+
+          - `south`: southern latitude limit (degrees)
+
+          - `west`: western longitude limit (degrees)
+
+          - `north`: northern latitude limit (degrees)
+
+          - `east`: eastern longitude limit (degrees), which is less than
+            `west` if the box spans the antimeridian
+
+        Returns
+        -------
+
+          - `pd.DataFrame`: data of the counties whose centroids are within
+            the box, in master row order
+        """
+        _,rows = _within_bbox(south,west,north,east)
+        return _master().iloc[rows].reset_index(drop=True)
+
+    @staticmethod
+    def within_bbox_many(
+        south:list[float]|np.ndarray,
+        west:list[float]|np.ndarray,
+        north:list[float]|np.ndarray,
+        east:list[float]|np.ndarray,
+        ) -> tuple[np.ndarray,np.ndarray]:
+        """Get the counties within many latitude/longitude boxes at once
+
+        Arguments
+        ---------
+
+          - `south`: southern latitude limits (degrees)
+
+          - `west`: western longitude limits (degrees)
+
+          - `north`: northern latitude limits (degrees)
+
+          - `east`: eastern longitude limits (degrees)
+
+        Returns
+        -------
+
+          - `np.ndarray`: box index of each match, in increasing order
+
+          - `np.ndarray`: FIPS code of each matching county, in master row
+            order for each box
+        """
+        queries,rows = _within_bbox(south,west,north,east)
+        return queries,_arrays()["FIPS"][rows]
+
+    @staticmethod
+    def by_geohash_prefix(prefix:str) -> pd.DataFrame:
+        """Get the counties whose centroids are within a geohash cell
+
+        Arguments
+        ---------
+
+          - `prefix`: geohash prefix, e.g., `"9q9"`
+
+        Returns
+        -------
+
+          - `pd.DataFrame`: data of the counties whose `GEOHASH` starts with
+            the prefix, in order of `GEOHASH`
+        """
+        _,rows = _by_geohash_prefix(prefix)
+        return _master().iloc[rows].reset_index(drop=True)
+
+    @staticmethod
+    def by_geohash_prefix_many(prefixes:list[str]|np.ndarray) -> tuple[np.ndarray,np.ndarray]:
+        """Get the counties whose centroids are within many geohash cells
+
+        Arguments
+        ---------
+
+          - `prefixes`: geohash prefixes, which need not all have the same
+            number of characters
+
+        Returns
+        -------
+
+          - `np.ndarray`: prefix index of each match, in increasing order
+
+          - `np.ndarray`: FIPS code of each matching county, in order of
+            `GEOHASH` for each prefix
+        """
+        queries,rows = _by_geohash_prefix(prefixes)
+        return queries,_arrays()["FIPS"][rows]
+
+    @staticmethod
+    def distance_matrix() -> np.ndarray:
+        """Get the great circle distances between all county centroids
+
+        The matrix is computed once and saved in the cache folder (see
+        `FIPS_CACHE_DIR`), then memory mapped read-only, so that all the
+        processes using it share a single copy.
+
+        Returns
+        -------
+
+          - `np.ndarray`: distances (km) as a `float32` array of shape
+            `(n,n)` with rows and columns in master row order (see `FIPS`)
+        """
+        return _distance_matrix()
+
+    @staticmethod
+    def raster(resolution:float=0.01) -> dict[str,np.ndarray]:
+        """Get the nearest county rasters
+
+        Each raster is a grid over one of the `RASTER_EXTENTS` of the master
+        row position of the county whose centroid is nearest to the center
+        of each cell. The rasters are computed once, in parallel bands of
+        rows, and saved in the cache folder (see `FIPS_CACHE_DIR`), then
+        memory mapped read-only.
+
+        Arguments
+        ---------
+
+          - `resolution`: cell size (degrees)
+
+        Returns
+        -------
+
+          - `dict[str,np.ndarray]`: `uint16` rasters by extent name, with row
+            0 at the southern limit and column 0 at the western limit
+        """
+        return {name:_raster(name,float(resolution)) for name in RASTER_EXTENTS}
+
+    @staticmethod
+    def locate_many(
+        lat:list[float]|np.ndarray,
+        lon:list[float]|np.ndarray,
+        resolution:float=0.01,
+        ) -> np.ndarray:
+        """Get the counties nearest to many locations using the rasters
+
+        Locations within the `RASTER_EXTENTS` are assigned the nearest county
+        to the center of their raster cell, so the result is only as precise
+        as the raster resolution. Locations outside the extents are assigned
+        the nearest county as by `nearest_many()`. Coordinates must be
+        finite.
+
+        Arguments
+        ---------
+
+          - `lat`: latitudes (degrees)
+
+          - `lon`: longitudes (degrees)
+
+          - `resolution`: raster cell size (degrees)
+
+        Returns
+        -------
+
+          - `np.ndarray`: FIPS codes of the counties
+        """
+        lat = np.asarray(lat,dtype=float).ravel()
+        lon = np.asarray(lon,dtype=float).ravel()
+        _check_locations(lat,lon)
+        rows = np.full(len(lat),-1,dtype=np.intp)
+        for name,(south,west,_,_) in RASTER_EXTENTS.items():
+            grid = _raster(name,float(resolution))
+            i = np.floor((lat - south) / resolution).astype(np.intp)
+            j = np.floor((lon - west) / resolution).astype(np.intp)
+            found = (rows < 0) & (i >= 0) & (i < grid.shape[0]) & (j >= 0) & (j < grid.shape[1])
+            rows[found] = grid[i[found],j[found]]
+        missing = np.flatnonzero(rows < 0)
+        if missing.size:
+            rows[missing] = _tree().query(to_xyz(lat[missing],lon[missing]))[1][:,0]
+        return _arrays()["FIPS"][rows]
+
+class _ResultsCache:
+    """Least recently used cache of `Counties` frames"""
+    def __init__(self,maxsize:int=0):
+        self.maxsize = maxsize
+        self.frames = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def key(self,*args) -> tuple|None:
+        """Get the cache key of `Counties` arguments
+
+        Returns
+        -------
+
+          - `tuple|None`: normalized arguments, or `None` if the cache is
+            disabled or the arguments cannot be cached
+        """
+        if not self.maxsize:
+            return None
+        state,use_index,selection,set_index = args
+        if isinstance(state,str):
+            state = [state]
+        try:
+            key = tuple(_normalize(x)
+                for x in (state,use_index or None,selection or None,set_index or None))
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def get(self,key:tuple|None) -> pd.DataFrame|None:
+        """Get a cached frame, if any"""
+        if key is None:
+            return None
+        with self.lock:
+            data = self.frames.get(key)
+            if data is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.frames.move_to_end(key)
+            return data
+
+    def put(self,key:tuple,data:pd.DataFrame):
+        """Add a frame, evicting the least recently used frames if needed"""
+        with self.lock:
+            self.frames[key] = data
+            self.frames.move_to_end(key)
+            while len(self.frames) > self.maxsize:
+                self.frames.popitem(last=False)
+
+    def resize(self,maxsize:int):
+        """Change the maximum number of frames"""
+        if maxsize < 0:
+            raise ValueError(f"{maxsize=} is negative")
+        with self.lock:
+            self.maxsize = maxsize
+            while len(self.frames) > self.maxsize:
+                self.frames.popitem(last=False)
+
+    def info(self) -> CacheInfo:
+        """Get the cache statistics"""
+        with self.lock:
+            return CacheInfo(self.hits,self.misses,self.maxsize,len(self.frames))
+
+    def clear(self):
+        """Remove all frames and reset the statistics"""
+        with self.lock:
+            self.frames.clear()
+            self.hits = self.misses = 0
+
+_RESULTS = _ResultsCache()
+"""Results cache of `Counties` frames, disabled until `Counties.set_cache()`"""
+
+def _normalize(value):
+    """Convert lists in `Counties` arguments to tuples"""
+    if isinstance(value,(list,tuple)):
+        return tuple(_normalize(x) for x in value)
+    return value
+
+def _private(data:pd.DataFrame) -> pd.DataFrame:
+    """Get a frame that can be modified without affecting a cached frame"""
+    return data.copy(deep=int(pd.__version__.split(".",1)[0]) < 3)
+
+@functools.cache
+def _master() -> pd.DataFrame:
+    """Get the master counties data frame
+
+    The master data frame is built only once per process, on first use, from
+    the master counties data columns. The frame returned is shared by all
+    `Counties` objects and must never be modified or handed to callers
+    directly. Derived frames are obtained only through non-inplace
+    operations, which return new objects (copy-on-write in pandas 3 and
+    later, copies otherwise), so callers can modify their own frames without
+    affecting the master copy.
+
+    Returns
+    -------
+
+      - `pd.DataFrame`: the master counties data frame
+    """
+    return pd.DataFrame({
+        name:pd.Series(values,dtype=str) if _SCHEMA[name] == "U"
+            else np.array(values,dtype=_SCHEMA[name])
+        for name,values in _columns().items()})
+
+def _check_locations(lat,lon):
+    """Check that locations have finite coordinates
+
+    Arguments
+    ---------
+
+      - `lat`: latitudes (degrees)
+
+      - `lon`: longitudes (degrees)
+    """
+    invalid = ~(np.isfinite(lat) & np.isfinite(lon))
+    if invalid.any():
+        raise ValueError(f"location {np.flatnonzero(invalid.ravel())[0]} "
+            "is not a valid latitude and longitude")
+
+def _rows(fips,strict=False):
+    """Get the master row positions of county FIPS codes
+
+    Arguments
+    ---------
+
+      - `fips`: county FIPS codes, or integer county FIPS codes, which may
+        be nullable integers or floats with missing values
+
+      - `strict`: raise an exception for unknown codes instead of returning
+        -1
+
+    Returns
+    -------
+
+      - `np.ndarray`: master row positions, with the shape of `fips`
+    """
+    if isinstance(getattr(fips,"dtype",None),pd.api.extensions.ExtensionDtype) \
+            and pd.api.types.is_integer_dtype(fips.dtype):
+        fips = fips.to_numpy(dtype=float,na_value=np.nan)
+    fips = np.asarray(fips)
+    if np.issubdtype(fips.dtype,np.integer):
+        rows = _bulk_index("FIPSCODE").get_indexer(fips.ravel())
+    elif np.issubdtype(fips.dtype,np.floating):
+        # missing and non-integral codes are not found
+        valid = np.isfinite(fips) & (fips == np.trunc(fips))
+        rows = _bulk_index("FIPSCODE").get_indexer(np.where(valid,fips,-1).astype(np.int64).ravel())
+    else:
+        rows = _bulk_index("FIPS").get_indexer(fips.ravel().astype(object))
+    if strict and (rows < 0).any():
+        raise KeyError(f"{fips.ravel()[rows < 0][0].tolist()!r} is not a valid county FIPS code")
+    return rows.reshape(fips.shape)
+
+@functools.cache
+def _state_ranges() -> dict[str,tuple[int,int]]:
+    """Get the master rows of each state
+
+    The counties are in order of FIPS code, so the counties of each state
+    are contiguous master rows.
+
+    Returns
+    -------
+
+      - `dict[str,tuple[int,int]]`: first master row and master row after the
+        last by state abbreviation
+    """
+    st = _arrays()["ST"]
+    starts = np.flatnonzero(np.append(True,st[1:] != st[:-1]))
+    stops = np.append(starts[1:],len(st))
+    ranges = {str(st[x]):(int(x),int(y)) for x,y in zip(starts,stops)}
+    if len(ranges) != len(starts):
+        raise ValueError("counties data is not in order of state")
+    return ranges
+
+@functools.cache
+def _bulk_index(column:str) -> pd.Index:
+    """Get a county FIPS code hash index used for bulk lookups
+
+    Arguments
+    ---------
+
+      - `column`: county FIPS code column (`"FIPS"` or `"FIPSCODE"`)
+
+    Returns
+    -------
+
+      - `pd.Index`: county FIPS codes in master row order
+    """
+    return pd.Index(_master()[column])
+
+@functools.cache
+def _arrays() -> dict[str,np.ndarray]:
+    """Get the read-only master counties data column arrays
+
+    Returns
+    -------
+
+      - `dict[str,np.ndarray]`: column arrays in master row order
+    """
+    arrays = {}
+    for column in _master().columns:
+        arrays[column] = _master()[column].to_numpy(copy=True)
+        arrays[column].flags.writeable = False
+    return arrays
+
+@functools.cache
+def _tree() -> KDTree:
+    """Get the k-d tree of the county centroids
+
+    The tree is built once per process from the county centroids as unit
+    vectors, with points in master row order.
+
+    Returns
+    -------
+
+      - `KDTree`: county centroids tree
+    """
+    data = _master()
+    return KDTree(to_xyz(data["LAT"],data["LON"]))
+
+@functools.cache
+def _distance_matrix() -> np.ndarray:
+    """Get the county centroids distance matrix
+
+    The matrix is loaded once per process from the cache, and computed in
+    blocks of rows if it is not cached yet.
+
+    Returns
+    -------
+
+      - `np.ndarray`: read-only great circle distances (km)
+    """
+    lat,lon = _arrays()["LAT"],_arrays()["LON"]
+    def fill(matrix):
+        for start in range(0,len(lat),256):
+            stop = start + 256
+            matrix[start:stop] = haversine(lat[start:stop,None],lon[start:stop,None],lat,lon)
+    return cached_array("distance",(len(lat),len(lat)),"float32",fill)
+
+@functools.cache
+def _group_ids(column:str) -> tuple[np.ndarray,np.ndarray,np.ndarray|None,np.ndarray]:
+    """Get the groups of counties with the same column value
+
+    Arguments
+    ---------
+
+      - `column`: grouping column
+
+    Returns
+    -------
+
+      - `np.ndarray`: group names in sorted order
+
+      - `np.ndarray`: group of each county in master row order
+
+      - `np.ndarray|None`: master row positions in group order, or `None`
+        if the counties are already in group order
+
+      - `np.ndarray`: first position of each group in group order
+    """
+    names,ids = np.unique(_arrays()[column].astype(str),return_inverse=True)
+    order = np.argsort(ids,kind="stable")
+    starts = np.searchsorted(ids[order],np.arange(len(names)))
+    if (order == np.arange(len(order))).all():
+        order = None
+    for array in (names,ids,order,starts):
+        if array is not None:
+            array.flags.writeable = False
+    return names,ids,order,starts
+
+@functools.cache
+def _members(column:str) -> tuple[np.ndarray,np.ndarray,np.ndarray]:
+    """Get the members of a multi-valued column
+
+    Values are split on `"|"` only once per process.
+
+    Arguments
+    ---------
+
+      - `column`: multi-valued column
+
+    Returns
+    -------
+
+      - `np.ndarray`: member names in sorted order
+
+      - `np.ndarray`: master row position of each membership, in increasing
+        order
+
+      - `np.ndarray`: member of each membership
+    """
+    values = [x.split("|") for x in _arrays()[column].astype(str)]
+    rows = np.repeat(np.arange(len(values)),[len(x) for x in values])
+    names,ids = np.unique([y for x in values for y in x],return_inverse=True)
+    for array in (names,rows,ids):
+        array.flags.writeable = False
+    return names,rows,ids
+
+@functools.cache
+def _bitmaps(column:str) -> dict:
+    """Get the county bitmaps of each value of a column
+
+    Arguments
+    ---------
+
+      - `column`: column name, with multiple `RO` values separated by `"|"`
+
+    Returns
+    -------
+
+      - `dict`: read-only bitmaps packed with `np.packbits()` by value
+    """
+    if column == "RO":
+        names,membership = _membership(column)
+        masks = zip(names.tolist(),membership.T)
+    else:
+        names,ids = np.unique(_arrays()[column],return_inverse=True)
+        masks = ((name,ids == n) for n,name in enumerate(names.tolist()))
+    bitmaps = {}
+    for name,mask in masks:
+        bitmaps[name] = np.packbits(mask)
+        bitmaps[name].flags.writeable = False
+    return bitmaps
+
+@functools.cache
+def _inverted_index(column:str) -> dict[str,np.ndarray]:
+    """Get the rows of each member of a multi-valued column
+
+    Arguments
+    ---------
+
+      - `column`: multi-valued column
+
+    Returns
+    -------
+
+      - `dict[str,np.ndarray]`: master row positions in increasing order by
+        member name
+    """
+    names,rows,ids = _members(column)
+    order = np.argsort(ids,kind="stable")
+    index = {}
+    splits = np.searchsorted(ids[order],np.arange(1,len(names)))
+    for name,found in zip(names,np.split(rows[order],splits)):
+        found.flags.writeable = False
+        index[str(name)] = found
+    return index
+
+@functools.cache
+def _membership(column:str) -> tuple[np.ndarray,np.ndarray]:
+    """Get the membership matrix of a multi-valued column
+
+    Arguments
+    ---------
+
+      - `column`: multi-valued column
+
+    Returns
+    -------
+
+      - `np.ndarray`: member names in sorted order
+
+      - `np.ndarray`: boolean array of shape `(counties,members)`
+    """
+    names,rows,ids = _members(column)
+    membership = np.zeros((len(_master()),len(names)),dtype=bool)
+    membership[rows,ids] = True
+    membership.flags.writeable = False
+    return names,membership
+
+@functools.cache
+def _aggregation_matrix(column:str,weights:str|tuple) -> tuple[np.ndarray,CSRMatrix]:
+    """Compute a county to region aggregation matrix
+
+    Arguments
+    ---------
+
+      - `column`: region column
+
+      - `weights`: `"equal"`, `"full"`, or region weights as sorted
+        (region,weight) pairs
+
+    Returns
+    -------
+
+      - `np.ndarray`: region names
+
+      - `CSRMatrix`: aggregation matrix
+    """
+    names,rows,ids = _members(column)
+    if isinstance(weights,tuple):
+        weights = dict(weights)
+        values = np.array([float(weights.get(x,0.0)) for x in names])[ids]
+    else:
+        values = np.ones(len(rows))
+    if weights != "full":
+        total = np.bincount(rows,weights=values,minlength=len(_master()))[rows]
+        if (total <= 0).any():
+            invalid = sorted(set(_arrays()[column][rows[total <= 0]]))
+            raise ValueError(f"weights of {invalid} are not positive")
+        values = values / total
+    return names,CSRMatrix.from_coo(ids,rows,values,(len(names),len(_master())))
+
+@functools.cache
+def _zoneinfo(name:str) -> zoneinfo.ZoneInfo:
+    """Get a time zone
+
+    Each time zone is loaded only once per process.
+
+    Arguments
+    ---------
+
+      - `name`: IANA time zone name
+
+    Returns
+    -------
+
+      - `zoneinfo.ZoneInfo`: time zone
+    """
+    return zoneinfo.ZoneInfo(name)
+
+@functools.cache
+def _timezone_codes() -> tuple[np.ndarray,np.ndarray]:
+    """Get the county time zones as integer codes
+
+    Returns
+    -------
+
+      - `np.ndarray`: time zone code of each county in master row order
+
+      - `np.ndarray`: time zone name of each code
+    """
+    codes,names = pd.factorize(_arrays()["TIMEZONE"])
+    codes.flags.writeable = False
+    return codes,np.asarray(names)
+
+@functools.cache
+def _offset_groups() -> tuple[np.ndarray,np.ndarray]:
+    """Get the groups of counties with the same `TZOFFSET` and `DST`
+
+    Returns
+    -------
+
+      - `np.ndarray`: `TZOFFSET` and `DST` of each group, as an array of
+        shape `(groups,2)`
+
+      - `np.ndarray`: group of each county in master row order
+    """
+    keys,groups = np.unique(np.stack([_arrays()["TZOFFSET"],_arrays()["DST"]],axis=1),
+        axis=0,return_inverse=True)
+    groups = groups.ravel()
+    keys.flags.writeable = False
+    groups.flags.writeable = False
+    return keys,groups
+
+@functools.cache
+def _offset_year(year:int) -> np.ndarray:
+    """Get the hourly UTC offsets of the county groups in a year
+
+    Arguments
+    ---------
+
+      - `year`: calendar year
+
+    Returns
+    -------
+
+      - `np.ndarray`: read-only UTC offsets (hours) of each group
+    """
+    keys,_ = _offset_groups()
+    hours = np.arange(np.datetime64(f"{year}-01-01T00","h"),np.datetime64(f"{year+1}-01-01T00","h"))
+    offsets = localtime.utc_offset(hours[None,:],keys[:,:1],keys[:,1:]).astype(np.int8)
+    offsets.flags.writeable = False
+    return offsets
+
+@functools.cache
+def _raster(name:str,resolution:float) -> np.ndarray:
+    """Get a nearest county raster
+
+    The raster is loaded once per process from the cache, and computed in
+    bands of rows by a pool of threads if it is not cached yet.
+
+    Arguments
+    ---------
+
+      - `name`: extent name
+
+      - `resolution`: cell size (degrees)
+
+    Returns
+    -------
+
+      - `np.ndarray`: read-only master row positions
+    """
+    south,west,north,east = RASTER_EXTENTS[name]
+    shape = (int(np.ceil((north-south)/resolution - 1e-9)),
+        int(np.ceil((east-west)/resolution - 1e-9)))
+    lon = west + (np.arange(shape[1]) + 0.5) * resolution
+    def fill_band(raster,start,stop):
+        lat = south + (np.arange(start,min(stop,shape[0])) + 0.5) * resolution
+        points = to_xyz(np.repeat(lat,len(lon)),np.tile(lon,len(lat)))
+        raster[start:stop] = _tree().query(points)[1].reshape(len(lat),len(lon))
+    def fill(raster):
+        band = max(1,65536 // shape[1])
+        with concurrent.futures.ThreadPoolExecutor() as pool:
+            for result in [pool.submit(fill_band,raster,start,start+band)
+                    for start in range(0,shape[0],band)]:
+                result.result()
+    return cached_array(f"raster-{name}-{resolution:g}",shape,"uint16",fill)
+
+@functools.cache
+def _sorted(column:str) -> tuple[np.ndarray,np.ndarray]:
+    """Get a master counties data column in sorted order
+
+    The sorted column is built once per process for binary searches, with
+    strings as a fixed width unicode array.
+
+    Arguments
+    ---------
+
+      - `column`: column name
+
+    Returns
+    -------
+
+      - `np.ndarray`: master row positions in order of the column values
+
+      - `np.ndarray`: column values in increasing order
+    """
+    order = np.argsort(_arrays()[column],kind="stable")
+    order.flags.writeable = False
+    values = _arrays()[column][order]
+    if values.dtype == object:
+        values = values.astype(str)
+    values.flags.writeable = False
+    return order,values
+
+def _ranges(order,start,stop):
+    """Expand ranges of sorted positions into (query,row) pairs
+
+    Arguments
+    ---------
+
+      - `order`: master row positions in sorted order
+
+      - `start`: first sorted position of each query
+
+      - `stop`: sorted position after the last of each query
+
+    Returns
+    -------
+
+      - `np.ndarray`: query index of each row, in increasing order
+
+      - `np.ndarray`: master row position of each row, in sorted order for
+        each query
+    """
+    count = np.maximum(stop - start,0)
+    queries = np.repeat(np.arange(len(start)),count)
+    offsets = np.arange(count.sum()) - np.repeat(np.cumsum(count)-count,count)
+    return queries,order[offsets + start[queries]]
+
+def _within_bbox(south,west,north,east):
+    """Find the county centroids within latitude/longitude boxes
+
+    Candidates are found by binary search of the latitude limits in the
+    centroids sorted by latitude, then filtered by the longitude limits.
+
+    Returns
+    -------
+
+      - `np.ndarray`: box index of each match, in increasing order
+
+      - `np.ndarray`: master row position of each match, in increasing order
+        for each box
+    """
+    south,west,north,east = (np.asarray(x,dtype=float).ravel()
+        for x in np.broadcast_arrays(south,west,north,east))
+    order,lat = _sorted("LAT")
+    queries,rows = _ranges(order,
+        np.searchsorted(lat,south,side="left"),
+        np.searchsorted(lat,north,side="right"))
+    lon = _arrays()["LON"][rows]
+    wraps = west[queries] > east[queries]
+    inside = np.where(wraps,
+        (lon >= west[queries]) | (lon <= east[queries]),
+        (lon >= west[queries]) & (lon <= east[queries]))
+    queries,rows = queries[inside],rows[inside]
+    order = np.lexsort((rows,queries))
+    return queries[order],rows[order]
+
+def _by_geohash_prefix(prefixes):
+    """Find the county centroids within geohash cells
+
+    Matches are found by binary search of each prefix and its successor in
+    the geohashes sorted in increasing order.
+
+    Returns
+    -------
+
+      - `np.ndarray`: prefix index of each match, in increasing order
+
+      - `np.ndarray`: master row position of each match, in geohash order
+        for each prefix
+    """
+    prefixes = np.char.lower(np.asarray(prefixes,dtype=str).ravel())
+    order,geohash = _sorted("GEOHASH")
+    # geohash characters all precede "~", so every value with the prefix
+    # sorts before the prefix followed by "~"
+    return _ranges(order,
+        np.searchsorted(geohash,prefixes,side="left"),
+        np.searchsorted(geohash,np.char.add(prefixes,"~"),side="left"))
@@ -0,0 +1,123 @@
+"""US states data frame
+
+See `fips.states` for details. This module is loaded only when the states
+data frame is used because it requires `pandas`.
+"""
+
+import functools
+
+import numpy as np
+import pandas as pd
+
+from fips.states import encode_fips, _COLUMNS, _STATES, _TERRITORIES, _CANADA, _MEXICO
+
+class States(pd.DataFrame):
+    """US states dataframe
+
+    Columns
+    -------
+
+      - `STATE`: state name
+
+      - `ST`: state abbreviation
+
+      - `FIPS`: state FIPS code
+
+      - `TZOFFSET`: state timezone offset
+
+      - `DST`: flag to indicate whether summer time is observed
+
+      - `SYSTEM`: system interconnection name
+
+      - `RO`: reliability organization name(s), split using `"|"`
+
+      - `FIPSCODE`: state FIPS code as an `int8` (see `encode_fips()`)
+
+    Caveat
+    ------
+
+      - Time zones and summer time are not uniformly observed in some states.
+        See `fips.counties.Counties` for a more granular determination of
+        these values.
+
+      - Some states are in multiple systems and/or have multiple reliability
+        organizations. In such cases only the system that covers the major
+        population center(s) is provided, but the reliability organizations
+        are all listed, seperated by `"|"`.
+    """
+    def __init__(self,
+        with_territories:bool=False,
+        with_canada:bool=False,
+        with_mexico:bool=False,
+        use_index:str|list[str]=None
+        ):
+        """Construct states data frame
+
+        Arguments
+        ---------
+
+          - `with_territories`: append US territories (PR and VI)
+
+          - `with_canada`: append Canadian provinces (provinces listed
+            under "STATE"--sorry)
+
+          - `with_mexico`: append Baja California (listed under "STATE" as
+            `"MEXICO"`)
+
+          - `use_index`: specify index to initially set
+        """
+        data = _master()
+        mask = _kind_mask("STATE")
+        if with_territories:
+            mask = mask | _kind_mask("TERRITORY")
+        if with_canada:
+            mask = mask | _kind_mask("CANADA")
+        if with_mexico:
+            mask = mask | _kind_mask("MEXICO")
+        data = data.loc[mask,data.columns != "KIND"].reset_index(drop=True)
+        if use_index:
+            data = data.set_index(use_index)
+        super().__init__(data.sort_index())
+
+@functools.cache
+def _master() -> pd.DataFrame:
+    """Get the master states data frame
+
+    The master data frame is built only once per process, on first use, and
+    includes all states, territories, and provinces tagged by `KIND`. The
+    frame returned is shared by all `States` objects and must never be
+    modified or handed to callers directly.
+
+    Returns
+    -------
+
+      - `pd.DataFrame`: the master states data frame
+    """
+    data = pd.DataFrame(
+        columns=_COLUMNS,
+        data=_STATES + _TERRITORIES + _CANADA + _MEXICO,
+        )
+    data["FIPSCODE"] = encode_fips(data["FIPS"])
+    data["KIND"] = ["STATE"] * len(_STATES) \
+        + ["TERRITORY"] * len(_TERRITORIES) \
+        + ["CANADA"] * len(_CANADA) \
+        + ["MEXICO"] * len(_MEXICO)
+    return data
+
+@functools.cache
+def _kind_mask(kind:str) -> np.ndarray:
+    """Get the read-only master row mask of a kind of state
+
+    Arguments
+    ---------
+
+      - `kind`: `"STATE"`, `"TERRITORY"`, `"CANADA"`, or `"MEXICO"`
+
+    Returns
+    -------
+
+      - `np.ndarray`: boolean mask of master rows of that kind
+    """
+    mask = (_master()["KIND"] == kind).to_numpy()
+    mask.flags.writeable = False
+    return mask
@@ -24,34 +24,95 @@ which outputs
        Weston       WECC  56045  43.846213 -104.570020  9xv9km      -7.0    1  WECC
 """
 
+import array
+import csv
+import functools
+import hashlib
+import os
+import struct
+import sys
+import warnings
 from io import StringIO
 
-import pandas as pd
+__all__ = ["County","Counties","encode_fips","decode_fips","save_snapshot"]
+
+def __getattr__(name):
+    # the counties data frame requires pandas, so it is only loaded when used
+    if name == "Counties":
+        # pylint: disable=import-outside-toplevel,cyclic-import,redefined-outer-name
+        from fips._counties import Counties
+        return Counties
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 class County:
+    # pylint: disable=no-member
     """Get county data
 
     See `Counties()` for list of available county data. 
     """
-    def __init__(self,**kwargs):
-        """Construct a single county data object
+    __slots__ = ("ST","FIPS","COUNTY","LAT","LON","GEOHASH","TZOFFSET","DST","SYSTEM","RO")
+
+    def __new__(cls,**kwargs):
+        """Get a single county data object
+
+        County data objects are immutable and interned, so equal search
+        criteria always return the same object, and objects compare and hash
+        by FIPS code.
 
         # Arguments 
 
         -  `**kwargs`: search criteria (e.g., `{ST="CA",COUNTY="Alameda"}`)
         """
-        keys = list(kwargs.keys())
-        values = list(kwargs.values())
+        if list(kwargs) == ["FIPS"]:
+            return cls.from_fips(kwargs["FIPS"])
 
         try:
-            self.data = Counties().set_index(keys).loc[[values]].reset_index()
-        except KeyError:
-            self.data = None
-        if self.data is None or len(self.data) > 1:
+            rows = _key_index(tuple(kwargs))[tuple(kwargs.values())]
+        except (KeyError,TypeError,ValueError):
+            rows = []
+        if len(rows) != 1:
             raise KeyError(f"{kwargs=} is not a valid unique key")
+        return _instance(rows[0])
+
+    @classmethod
+    def from_fips(cls,fips:str) -> "County":
+        """Get a single county data object from its FIPS code
+
+        # Arguments
+
+        - `fips`: county FIPS code (e.g., `"06001"`)
+
+        # Returns
+
+        - `County`: county data object
+        """
+        try:
+            return _instance(_fips_index()[fips])
+        except (KeyError,TypeError) as err:
+            raise KeyError(f"{fips=} is not a valid county FIPS code") from err
+
+    def __setattr__(self,key,value):
+        raise AttributeError(f"{type(self).__name__} objects are immutable")
 
-    def __getattr__(self,key):
-        return self.data[key].iloc[0]
+    def __delattr__(self,key):
+        raise AttributeError(f"{type(self).__name__} objects are immutable")
+
+    def __eq__(self,other):
+        if not isinstance(other,County):
+            return NotImplemented
+        return self.FIPS == other.FIPS
+
+    def __hash__(self):
+        return hash(self.FIPS)
+
+    def __reduce__(self):
+        return (County.from_fips,(self.FIPS,))
+
+    @property
+    def data(self) -> "pd.DataFrame":
+        """One-row data frame of the county data"""
+        import pandas as pd # pylint: disable=import-outside-toplevel
+        return pd.DataFrame([self.to_dict()])
 
     def __str__(self):
         return f"{self.COUNTY} {self.ST} ({self.GEOHASH})"
@@ -61,65 +122,364 @@ class County:
 
     def to_dict(self):
         """Convert county data object to dict"""
-        return {x:y[0] for x,y in self.data.to_dict('list').items()}
+        return {x:getattr(self,x) for x in self.__slots__}
+
+def encode_fips(fips:"list[str]|np.ndarray|pd.Series") -> "np.ndarray":
+    """Convert county FIPS codes to integer codes
+
+    Arguments
+    ---------
+
+      - `fips`: county FIPS codes (e.g., `["06001","56045"]`)
+
+    Returns
+    -------
+
+      - `np.ndarray`: `int32` county FIPS codes
+    """
+    import numpy as np # pylint: disable=import-outside-toplevel
+    fips = np.asarray(fips,dtype=str)
+    if ((np.char.str_len(fips) != 5) | ~np.char.isdigit(fips)).any():
+        raise ValueError(f"{fips=} contains invalid county FIPS codes")
+    return fips.astype(np.int32)
 
-class Counties(pd.DataFrame):
-    """US counties dataframe
+def decode_fips(codes:"list[int]|np.ndarray|pd.Series") -> "np.ndarray":
+    """Convert integer codes to county FIPS codes
 
-    Columns
+    Arguments
+    ---------
+
+      - `codes`: integer county FIPS codes (e.g., `[6001,56045]`)
+
+    Returns
     -------
 
-      - `ST`: state abbreviation
+      - `np.ndarray`: zero-padded county FIPS code strings
+    """
+    import numpy as np # pylint: disable=import-outside-toplevel
+    codes = np.asarray(codes,dtype=np.int32).ravel()
+    if ((codes < 0) | (codes > 99999)).any():
+        raise ValueError(f"{codes=} contains invalid county FIPS codes")
+    digits = codes[:,None] // np.array([10000,1000,100,10,1],dtype=np.int32) % 10
+    return (digits + ord("0")).astype(np.uint8).view("S5").ravel().astype(str)
+
+def save_snapshot(pathname:str=None):
+    """Save the binary snapshot of the counties data
+
+    The snapshot is a compact columnar image of the counties data that is
+    shipped as package data and loaded by `County` and `Counties` using only
+    the standard library and without parsing. The embedded CSV data remains
+    the source of truth, so this must be run (e.g., using `make data`)
+    whenever the CSV data is changed.
+
+    Arguments
+    ---------
 
-      - `FIPS`: county FIPS code
+      - `pathname`: snapshot file name (default is `counties.dat` in the
+        package folder)
+    """
+    data = _read_csv()
+    columns = {}
+    for name,values in data.items():
+        if _SCHEMA[name] == "U":
+            columns[name] = "\0".join(values).encode("utf-8")
+        else:
+            values = array.array(_ARRAY_TYPES[_SCHEMA[name]],values)
+            if sys.byteorder == "big":
+                values.byteswap()
+            columns[name] = values.tobytes()
+    with open(pathname if pathname else _SNAPSHOT_PATH,"wb") as fh:
+        fh.write(_SNAPSHOT_HEADER.pack(
+            _SNAPSHOT_MAGIC,_data_digest(),len(data["FIPS"]),len(columns)))
+        for name,values in columns.items():
+            fh.write(_SNAPSHOT_COLUMN.pack(
+                name.encode(),_SCHEMA[name].encode(),len(values)))
+        for values in columns.values():
+            fh.write(values)
+
+@functools.cache
+def _columns() -> dict[str,list]:
+    """Get the master counties data columns
+
+    The counties data is loaded only once per process, on first use, from the
+    binary snapshot, or by parsing the embedded CSV data if the snapshot is
+    missing or out of date. The columns returned are shared by all `County`
+    and `Counties` objects and must never be modified.
+
+    Returns
+    -------
 
-      - `COUNTY`: county/parish/burrough name
-    
-      - `LAT`: county centroid latitude
+      - `dict[str,list]`: counties data columns in master row order
+    """
+    try:
+        return _read_snapshot()
+    except (OSError,ValueError) as err:
+        warnings.warn(f"unable to load counties snapshot ({err}), parsing CSV data instead")
+        return _read_csv()
 
-      - `LON`: county centroid longitude
+def _read_snapshot(pathname:str=None) -> dict[str,list]:
+    """Read the binary snapshot of the counties data
 
-      - `GEOHASH`: county centroid geohash
+    Arguments
+    ---------
 
-      - `TZOFFSET`: state timezone offset
+      - `pathname`: snapshot file name (default is `counties.dat` in the
+        package folder)
 
-      - `DST`: flag to indicate whether summer time is observed
+    Returns
+    -------
 
-      - `SYSTEM`: system interconnection name
+      - `dict[str,list]`: counties data columns
+    """
+    with open(pathname if pathname else _SNAPSHOT_PATH,"rb") as fh:
+        buffer = fh.read()
+    if len(buffer) < _SNAPSHOT_HEADER.size:
+        raise ValueError("snapshot is truncated")
+    magic,digest,rows,ncols = _SNAPSHOT_HEADER.unpack_from(buffer)
+    if magic != _SNAPSHOT_MAGIC:
+        raise ValueError("snapshot format is not valid")
+    if digest != _data_digest():
+        raise ValueError("snapshot is out of date")
+    offset = _SNAPSHOT_HEADER.size + ncols * _SNAPSHOT_COLUMN.size
+    if len(buffer) < offset:
+        raise ValueError("snapshot is truncated")
+    data = {}
+    for column in range(ncols):
+        name,dtype,size = _SNAPSHOT_COLUMN.unpack_from(buffer,
+            _SNAPSHOT_HEADER.size + column * _SNAPSHOT_COLUMN.size)
+        name = name.rstrip(b"\0").decode()
+        dtype = dtype.rstrip(b"\0").decode()
+        if offset + size > len(buffer):
+            raise ValueError("snapshot is truncated")
+        if dtype == "U":
+            values = buffer[offset:offset+size].decode("utf-8").split("\0")
+        else:
+            values = array.array(_ARRAY_TYPES[dtype])
+            values.frombytes(buffer[offset:offset+size])
+            if sys.byteorder == "big":
+                values.byteswap()
+            values = values.tolist()
+        if len(values) != rows:
+            raise ValueError(f"snapshot column {name} is not valid")
+        data[name] = values
+        offset += size
+    if list(data) != list(_SCHEMA):
+        raise ValueError("snapshot columns are not valid")
+    return data
 
-      - `RO`: reliability organization name
+def _read_csv() -> dict[str,list]:
+    """Parse the embedded CSV counties data
 
-    Caveat
-    ------
+    Returns
+    -------
 
-      - Some counties located along timezone boundaries may be split across
-        two timezones. In such cases, the timezone selected covers the
-        majority of the county's land area.
+      - `dict[str,list]`: counties data columns
     """
-    def __init__(self,
-        state:str=None,
-        use_index:str|list[str]=None,
-        selection:list=None,
-        set_index:str|list[str]=None
-        ):
-        """Construct a data frame of US counties
+    reader = csv.reader(StringIO(_COUNTIES_CSV.strip()))
+    names = next(reader)
+    data = {x:[] for x in _SCHEMA}
+    for row in reader:
+        for name,value in zip(names,row):
+            data[name].append(float(value) if _SCHEMA[name] == "<f8"
+                else int(value) if _SCHEMA[name] == "<i8" else value)
+        data["FIPSCODE"].append(int(data["FIPS"][-1]))
+        data["STATECODE"].append(data["FIPSCODE"][-1] // 1000)
+        data["TIMEZONE"].append(_timezone(*(data[x][-1] for x in ("ST","FIPS","TZOFFSET","DST"))))
+    return data
 
-        Arguments
-        ---------
+def _timezone(st:str,fips:str,tzoffset:float,dst:int) -> str:
+    """Get the IANA time zone of a county
 
-          - `state`: state abbreviation
+    Arguments
+    ---------
 
-          - `use_index`: use the specified column(s) as the index
+      - `st`: state abbreviation
 
-          - `selection`: row selection based on `use_index` 
+      - `fips`: county FIPS code
 
-          - `set_index`: index to to set on data frame after row selection
-        """
+      - `tzoffset`: county standard time offset
+
+      - `dst`: county daylight saving time flag
+
+    Returns
+
+      - `str`: IANA time zone name
+    """
+    key = (tzoffset,dst)
+    return _TIMEZONE_COUNTIES.get((fips,)+key,
+        _TIMEZONE_STATES.get((st,)+key,_TIMEZONES[key]))
+
+def _data_digest() -> bytes:
+    """Get the digest of the counties data
+
+    The digest covers the CSV data and everything the derived columns are
+    computed from, so snapshots and cached arrays are rebuilt when any of
+    them changes.
 
-        # See https://greenwichmeantime.com/time-zone/usa/{state}/counties/ for county timezones
-        data = pd.read_csv(
-            # pylint: disable=too-many-lines
-            StringIO("""
+    Returns
+
+      - `bytes`: counties data digest
+    """
+    derived = repr((_DERIVED_VERSION,_SCHEMA,_TIMEZONES,_TIMEZONE_STATES,_TIMEZONE_COUNTIES))
+    return hashlib.sha256((_COUNTIES_CSV + derived).encode("utf-8")).digest()[:16]
+
+@functools.cache
+def _fips_index() -> dict[str,int]:
+    """Get the county FIPS code index
+
+    The index is built once per process from the master counties data.
+
+    Returns
+    -------
+
+      - `dict[str,int]`: master row position of each county FIPS code
+    """
+    return {x:n for n,x in enumerate(_columns()["FIPS"])}
+
+@functools.cache
+def _records() -> tuple[tuple]:
+    """Get the county data records
+
+    The records are built once per process from the master counties data,
+    with one tuple of native Python values per row in the order of
+    `County.__slots__`.
+
+    Returns
+    -------
+
+      - `tuple[tuple]`: county data records in master row order
+    """
+    return tuple(zip(*[_columns()[x] for x in County.__slots__]))
+
+@functools.cache
+def _instance(row:int) -> County:
+    """Get the interned county data object of a master row
+
+    Arguments
+    ---------
+
+      - `row`: master row position
+
+    Returns
+    -------
+
+      - `County`: county data object
+    """
+    county = object.__new__(County)
+    for key,value in zip(County.__slots__,_records()[row]):
+        object.__setattr__(county,key,value)
+    return county
+
+@functools.cache
+def _key_index(keys:tuple[str]) -> dict[tuple,list[int]]:
+    """Get a county data index over a set of columns
+
+    Each index is built once per process the first time the set of columns
+    is used as a search criterion.
+
+    Arguments
+    ---------
+
+      - `keys`: column names
+
+    Returns
+    -------
+
+      - `dict[tuple,list[int]]`: master row positions of each key value
+    """
+    columns = [County.__slots__.index(x) for x in keys]
+    index = {}
+    for row,record in enumerate(_records()):
+        index.setdefault(tuple(record[x] for x in columns),[]).append(row)
+    return index
+
+_SCHEMA = {
+    "ST":"U",
+    "FIPS":"U",
+    "COUNTY":"U",
+    "LAT":"<f8",
+    "LON":"<f8",
+    "GEOHASH":"U",
+    "TZOFFSET":"<f8",
+    "DST":"<i8",
+    "SYSTEM":"U",
+    "RO":"U",
+    "FIPSCODE":"<i4",
+    "STATECODE":"|i1",
+    "TIMEZONE":"U",
+    }
+"""Counties data column types (`"U"` for strings, numpy type strings otherwise)"""
+
+_DERIVED_VERSION = 1
+"""Version of the derived columns computation, which must be incremented
+whenever `_read_csv()` changes how derived columns are computed"""
+
+_TIMEZONES = {
+    (-5.0,1):"America/New_York",
+    (-6.0,1):"America/Chicago",
+    (-7.0,1):"America/Denver",
+    (-7.0,0):"America/Phoenix",
+    (-8.0,1):"America/Los_Angeles",
+    (-9.0,1):"America/Anchorage",
+    (-10.0,1):"America/Adak",
+    (-10.0,0):"Pacific/Honolulu",
+    }
+"""IANA time zones by county standard time offset and daylight saving time flag"""
+
+_TIMEZONE_STATES = {
+    ("ID",-7.0,1):"America/Boise",
+    ("IN",-5.0,1):"America/Indiana/Indianapolis",
+    ("MI",-5.0,1):"America/Detroit",
+    ("MI",-6.0,1):"America/Menominee",
+    }
+"""IANA time zones that differ by state from `_TIMEZONES`"""
+
+_TIMEZONE_COUNTIES = {
+    ("02110",-9.0,1):"America/Juneau",
+    ("02180",-9.0,1):"America/Nome",
+    ("02220",-9.0,1):"America/Sitka",
+    ("02282",-9.0,1):"America/Yakutat",
+    ("18025",-5.0,1):"America/Indiana/Marengo",
+    ("18027",-5.0,1):"America/Indiana/Vincennes",
+    ("18037",-5.0,1):"America/Indiana/Vincennes",
+    ("18083",-5.0,1):"America/Indiana/Vincennes",
+    ("18101",-5.0,1):"America/Indiana/Vincennes",
+    ("18123",-6.0,1):"America/Indiana/Tell_City",
+    ("18125",-5.0,1):"America/Indiana/Petersburg",
+    ("18131",-5.0,1):"America/Indiana/Winamac",
+    ("18149",-6.0,1):"America/Indiana/Knox",
+    ("18155",-5.0,1):"America/Indiana/Vevay",
+    ("21111",-5.0,1):"America/Kentucky/Louisville",
+    ("21231",-5.0,1):"America/Kentucky/Monticello",
+    ("38065",-6.0,1):"America/North_Dakota/Center",
+    ("41045",-7.0,1):"America/Boise",
+    }
+"""IANA time zones that differ by county from `_TIMEZONE_STATES` and
+`_TIMEZONES`, which only apply to counties with the same standard time offset
+and daylight saving time flag as the time zone"""
+
+_ARRAY_TYPES = {"<f8":"d","<i8":"q","<i4":"i","|i1":"b"}
+"""Standard library array type codes of numeric column types"""
+
+_SNAPSHOT_PATH = os.path.join(os.path.dirname(__file__),"counties.dat")
+"""Default binary snapshot file name"""
+
+_SNAPSHOT_MAGIC = b"FIPSDAT3"
+"""Binary snapshot format identifier"""
+
+_SNAPSHOT_HEADER = struct.Struct("<8s16sII")
+"""Binary snapshot header layout (magic, data digest, rows, columns)"""
+
+_SNAPSHOT_COLUMN = struct.Struct("<16s8sI")
+"""Binary snapshot column layout (name, column type, size in bytes)
+
+Numeric columns are stored as little-endian arrays, and string columns are
+stored as NUL-separated UTF-8 text.
+"""
+
+# See https://greenwichmeantime.com/time-zone/usa/{state}/counties/ for county timezones
+# pylint: disable=too-many-lines
+_COUNTIES_CSV = """
 ST,FIPS,COUNTY,LAT,LON,GEOHASH,TZOFFSET,DST,SYSTEM,RO
 AL,01001,Autauga,32.532237,-86.64644,djf3h6,-6,1,EAST,SERC
 AL,01003,Baldwin,30.659218,-87.746067,dj3w7m,-6,1,EAST,SERC
@@ -3264,34 +3624,11 @@ WY,56041,Uinta,41.284726,-110.558947,9x36u5,-7,1,WECC,WECC
 WY,56043,Washakie,43.878831,-107.669052,9xg3tg,-7,1,WECC,WECC
 WY,56045,Weston,43.846213,-104.57002,9xv9km,-7,1,WECC,WECC
 """
-),
-            dtype={
-                "ST":str,
-                "FIPS":str,
-                "COUNTY":str,
-                "LAT":float,
-                "LON":float,
-                "GEOHASH":str,
-                "TZOFFSET":float,
-                "DST":int,
-                "SYSTEM":str,
-                "RO":str,
-                },
-            )
-
-        if not state is None:
-            data = data.set_index("ST").loc[[state]].reset_index()
-        if use_index:
-            data.set_index(use_index,inplace=True)
-        if selection:
-            data = data.loc[selection]
-        if set_index:
-            data.reset_index(inplace=True)
-            data.set_index(set_index,inplace=True)
-        super().__init__(data.sort_index())
 
 if __name__ == '__main__':
 
+    from fips._counties import Counties
+
     # pd.options.display.width = None
     # pd.options.display.max_rows = None
     # pd.options.display.max_columns = None
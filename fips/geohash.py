@@ -0,0 +1,176 @@
+"""Geohash encoding and decoding
+
+Geohashes are computed on integer arrays by interleaving the bits of the
+quantized longitudes and latitudes, so that large batches of points are
+encoded and decoded without looping over points or characters in Python.
+
+Examples
+--------
+
+To check the geohash of Alameda County's centroid use the command
+
+    from fips.geohash import encode, decode
+    print(encode(37.647139,-121.912488,6),decode("9q9q1v"))
+
+which outputs
+
+    9q9q1v (array(37.6473999), array(-121.90979004))
+
+To regenerate and verify the county `GEOHASH` column use the command
+
+    from fips.counties import Counties
+    from fips.geohash import encode
+    data = Counties()
+    print((encode(data.LAT,data.LON,6) == data.GEOHASH).all())
+
+which outputs
+
+    True
+"""
+
+import numpy as np
+
+ALPHABET = "0123456789bcdefghjkmnpqrstuvwxyz"
+"""Geohash base 32 character set"""
+
+MAX_PRECISION = 12
+"""Maximum number of geohash characters, limited by 64 bit integer codes"""
+
+_CHARS = np.frombuffer(ALPHABET.encode(),dtype=np.uint8).astype(np.uint32)
+"""Unicode code point of each 5 bit geohash value"""
+
+_VALUES = np.full(128,-1,dtype=np.int8)
+_VALUES[_CHARS] = np.arange(32)
+_VALUES[[ord(x) for x in ALPHABET.upper()]] = np.arange(32)
+"""Geohash value of each ASCII character, or -1 if invalid"""
+
+_MASKS = tuple((np.uint64(shift),np.uint64(mask)) for shift,mask in (
+    (16,0x0000FFFF0000FFFF),
+    (8,0x00FF00FF00FF00FF),
+    (4,0x0F0F0F0F0F0F0F0F),
+    (2,0x3333333333333333),
+    (1,0x5555555555555555),
+    ))
+"""Shifts and masks that spread the bits of a 32 bit integer to even bits"""
+
+def encode(
+    lat:float|np.ndarray,
+    lon:float|np.ndarray,
+    precision:int=6,
+    ) -> np.ndarray:
+    """Encode latitudes and longitudes as geohashes
+
+    Arguments
+    ---------
+
+      - `lat`: latitudes (degrees)
+
+      - `lon`: longitudes (degrees)
+
+      - `precision`: number of geohash characters (1 to 12)
+
+    Returns
+    -------
+
+      - `np.ndarray`: geohashes, with the broadcast shape of `lat` and `lon`,
+        which are empty strings where `lat` or `lon` is not finite
+    """
+    if not 1 <= precision <= MAX_PRECISION:
+        raise ValueError(f"{precision=} is not between 1 and {MAX_PRECISION}")
+    lat,lon = np.broadcast_arrays(np.asarray(lat,dtype=float),np.asarray(lon,dtype=float))
+    bits = 5 * precision
+    code = _interleave(_quantize(lon.ravel(),180.0,(bits+1)//2),
+        _quantize(lat.ravel(),90.0,bits//2),bits)
+    shifts = np.arange(bits-5,-1,-5,dtype=np.uint64)
+    chars = _CHARS[((code[:,None] >> shifts) & np.uint64(31)).astype(np.uint8)]
+    chars[~(np.isfinite(lat) & np.isfinite(lon)).ravel()] = 0
+    return chars.view(f"U{precision}").reshape(lat.shape)
+
+def decode(
+    geohash:str|np.ndarray,
+    errors:bool=False,
+    ) -> tuple[np.ndarray,...]:
+    """Decode geohashes as latitudes and longitudes
+
+    Geohashes need not all have the same number of characters, and are not
+    case sensitive. Empty geohashes (see `encode()`) are decoded as NaN.
+
+    Arguments
+    ---------
+
+      - `geohash`: geohashes
+
+      - `errors`: include the cell half sizes in the result
+
+    Returns
+    -------
+
+      - `np.ndarray`: latitudes of the cell centers (degrees)
+
+      - `np.ndarray`: longitudes of the cell centers (degrees)
+
+      - `np.ndarray`: latitude half sizes of the cells (degrees), if `errors`
+
+      - `np.ndarray`: longitude half sizes of the cells (degrees), if `errors`
+    """
+    # pylint: disable=too-many-locals
+    geohash = np.asarray(geohash,dtype=str)
+    shape = geohash.shape
+    geohash = geohash.ravel()
+    width = geohash.dtype.itemsize // 4
+    if width > MAX_PRECISION:
+        raise ValueError(f"geohash is longer than {MAX_PRECISION} characters")
+    chars = geohash.view(np.uint32).reshape(len(geohash),width)
+    length = (chars != 0).sum(axis=1)
+    values = _VALUES[np.minimum(chars,127)]
+    invalid = ((values < 0) & (chars != 0)).any(axis=1)
+    if invalid.any():
+        raise ValueError(f"{geohash[invalid][0]!r} is not a valid geohash")
+    shifts = np.arange(5*(width-1),-1,-5,dtype=np.uint64)
+    code = np.bitwise_or.reduce(np.where(chars != 0,values,0).astype(np.uint64) << shifts,axis=1)
+    bits = 5 * length
+    code >>= (5*(width-length)).astype(np.uint64)
+    lon,lat = _deinterleave(code,bits)
+    lon_bits,lat_bits = (bits+1)//2,bits//2
+    lat_error = 90.0 / 2.0**lat_bits
+    lon_error = 180.0 / 2.0**lon_bits
+    lat = np.where(length > 0,(lat*2+1)*lat_error - 90.0,np.nan)
+    lon = np.where(length > 0,(lon*2+1)*lon_error - 180.0,np.nan)
+    lat_error = np.where(length > 0,lat_error,np.nan)
+    lon_error = np.where(length > 0,lon_error,np.nan)
+    result = lat.reshape(shape),lon.reshape(shape)
+    if errors:
+        result += (lat_error.reshape(shape),lon_error.reshape(shape))
+    return result
+
+def _quantize(angle,limit,bits):
+    # cell number of each angle in [-limit,limit] divided into 2**bits cells,
+    # or 0 if the angle is not finite
+    cells = np.floor((np.where(np.isfinite(angle),angle,-limit) + limit) * (2.0**bits / (2*limit)))
+    return np.clip(cells,0,2**bits-1).astype(np.uint64)
+
+def _interleave(lon,lat,bits):
+    # geohash bits alternate starting with the most significant longitude bit
+    if bits % 2:
+        return _spread(lon) | (_spread(lat) << np.uint64(1))
+    return (_spread(lon) << np.uint64(1)) | _spread(lat)
+
+def _deinterleave(code,bits):
+    # inverse of _interleave for codes of varying numbers of bits
+    odd = (bits % 2).astype(np.uint64)
+    return _compact(code >> (1-odd)),_compact(code >> odd)
+
+def _spread(value):
+    # move bit i to bit 2i
+    value = value & np.uint64(0xFFFFFFFF)
+    for shift,mask in _MASKS:
+        value = (value | (value << shift)) & mask
+    return value
+
+def _compact(value):
+    # move bit 2i to bit i
+    value = value & _MASKS[-1][1]
+    masks = [mask for _,mask in reversed(_MASKS[:-1])] + [np.uint64(0xFFFFFFFF)]
+    for (shift,_),mask in zip(reversed(_MASKS),masks):
+        value = (value | (value >> shift)) & mask
+    return value
@@ -0,0 +1,147 @@
+"""US local time conversion
+
+Local times are computed from standard time offsets and daylight saving time
+flags (see `TZOFFSET` and `DST`) using the US daylight saving time rules in
+effect since 1967. The daylight saving time transitions are computed once per
+year, so conversions are vectorized over any number of timestamps.
+
+Examples
+--------
+
+To get the local time in Alameda County at noon UTC on July 4, 2025 use the
+command
+
+    import numpy as np
+    from fips.localtime import to_local
+    print(to_local(np.datetime64("2025-07-04T12:00"),-8,1))
+
+which outputs
+
+    2025-07-04T05:00:00
+"""
+
+import datetime as dt
+import functools
+
+import numpy as np
+
+def transitions(year:int) -> tuple[np.datetime64,np.datetime64]:
+    """Get the US daylight saving time transitions in a year
+
+    Arguments
+    ---------
+
+      - `year`: calendar year
+
+    Returns
+    -------
+
+      - `np.datetime64`: start of daylight saving time in local standard time
+
+      - `np.datetime64`: end of daylight saving time in local standard time,
+        which is the same as the start if daylight saving time is not used
+    """
+    return _transitions(int(year))
+
+def utc_offset(
+    utc:np.ndarray,
+    tzoffset:float|np.ndarray,
+    dst:int|np.ndarray,
+    ) -> np.ndarray:
+    """Get the UTC offsets at UTC timestamps
+
+    Arguments are broadcast against each other.
+
+    Arguments
+    ---------
+
+      - `utc`: UTC timestamps
+
+      - `tzoffset`: standard time offsets from UTC (hours)
+
+      - `dst`: daylight saving time flags
+
+    Returns
+    -------
+
+      - `np.ndarray`: UTC offsets (hours) including daylight saving time,
+        or NaN where `utc` is NaT
+    """
+    utc = _as_datetime64(utc)
+    utc,tzoffset,dst = np.broadcast_arrays(utc,
+        np.asarray(tzoffset,dtype=float),np.asarray(dst,dtype=bool))
+    valid = ~np.isnat(utc)
+    standard = utc + (tzoffset * 3600).astype("timedelta64[s]")
+    year = standard.astype("datetime64[Y]").astype(np.int64) + 1970
+    if not valid.any():
+        return np.where(valid,tzoffset,np.nan)
+    first = int(year[valid].min())
+    year = np.where(valid,year,first)
+    start,stop = (np.array(x,dtype="datetime64[s]")
+        for x in zip(*(_transitions(x) for x in range(first,int(year.max())+1))))
+    summer = dst & (standard >= start[year-first]) & (standard < stop[year-first])
+    return np.where(valid,tzoffset + summer,np.nan)
+
+def to_local(
+    utc:np.ndarray,
+    tzoffset:float|np.ndarray,
+    dst:int|np.ndarray,
+    ) -> np.ndarray:
+    """Convert UTC timestamps to local timestamps
+
+    Arguments are broadcast against each other.
+
+    Arguments
+    ---------
+
+      - `utc`: UTC timestamps
+
+      - `tzoffset`: standard time offsets from UTC (hours)
+
+      - `dst`: daylight saving time flags
+
+    Returns
+    -------
+
+      - `np.ndarray`: local timestamps, without time zone, or NaT where
+        `utc` is NaT
+    """
+    utc = _as_datetime64(utc)
+    offset = np.nan_to_num(utc_offset(utc,tzoffset,dst))
+    return utc + (offset * 3600).astype("timedelta64[s]")
+
+def _as_datetime64(utc):
+    # timestamps as a datetime64 array, in seconds unless more precise
+    utc = np.asarray(utc)
+    if not np.issubdtype(utc.dtype,np.datetime64):
+        utc = utc.astype("datetime64[s]")
+    return utc
+
+@functools.cache
+def _transitions(year):
+    """Compute the US daylight saving time transitions in a year
+
+    Daylight saving time starts at 2am local standard time and ends at 2am
+    local daylight time, which is 1am local standard time.
+    """
+    def sunday(month,week):
+        # the week-th Sunday of the month, counting back from the end if negative
+        if week > 0:
+            first = dt.date(year,month,1)
+            return first + dt.timedelta(days=(6-first.weekday())%7 + 7*(week-1))
+        last = dt.date(year+month//12,month%12+1,1) - dt.timedelta(days=1)
+        return last - dt.timedelta(days=(last.weekday()+1)%7 + 7*(-week-1))
+    if year < 1967:
+        return (np.datetime64(dt.date(year,1,1),"s"),)*2
+    if year >= 2007:
+        start,stop = sunday(3,2),sunday(11,1)
+    elif year >= 1987:
+        start,stop = sunday(4,1),sunday(10,-1)
+    elif year == 1974:
+        start,stop = dt.date(1974,1,6),sunday(10,-1)
+    elif year == 1975:
+        start,stop = dt.date(1975,2,23),sunday(10,-1)
+    else:
+        start,stop = sunday(4,-1),sunday(10,-1)
+    return (np.datetime64(start,"s") + np.timedelta64(2,"h"),
+        np.datetime64(stop,"s") + np.timedelta64(1,"h"))
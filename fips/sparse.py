@@ -0,0 +1,144 @@
+"""Sparse matrices
+
+Aggregation matrices, such as county to region matrices, have very few
+nonzero values. They are stored in compressed sparse row (CSR) format and
+multiplied by dense arrays using NumPy only, so SciPy is not required. When
+SciPy is installed, matrices can be converted using `CSRMatrix.to_scipy()`.
+
+Examples
+--------
+
+To sum three values into two groups use the command
+
+    import numpy as np
+    from fips.sparse import CSRMatrix
+    matrix = CSRMatrix.from_coo([0,0,1],[0,1,2],[1.0,1.0,1.0],(2,3))
+    print(matrix @ np.array([1.0,2.0,3.0]))
+
+which outputs
+
+    [3. 3.]
+"""
+
+import numpy as np
+
+class CSRMatrix:
+    """Compressed sparse row matrix"""
+    def __init__(self,
+        data:np.ndarray,
+        indices:np.ndarray,
+        indptr:np.ndarray,
+        shape:tuple[int,int],
+        ):
+        """Construct a compressed sparse row matrix
+
+        Arguments
+        ---------
+
+          - `data`: nonzero values in row order
+
+          - `indices`: column of each nonzero value
+
+          - `indptr`: position of the first nonzero value of each row, and
+            the number of nonzero values
+
+          - `shape`: number of rows and columns
+        """
+        self.data = np.asarray(data,dtype=float)
+        self.indices = np.asarray(indices,dtype=np.intp)
+        self.indptr = np.asarray(indptr,dtype=np.intp)
+        self.shape = tuple(shape)
+        if len(self.indptr) != self.shape[0] + 1 or len(self.data) != len(self.indices) \
+                or self.indptr[-1] != len(self.data):
+            raise ValueError("sparse matrix structure is not valid")
+        for array in (self.data,self.indices,self.indptr):
+            array.flags.writeable = False
+
+    @classmethod
+    def from_coo(cls,
+        rows:np.ndarray,
+        columns:np.ndarray,
+        values:np.ndarray,
+        shape:tuple[int,int],
+        ) -> "CSRMatrix":
+        """Construct a compressed sparse row matrix from coordinates
+
+        Values with the same coordinates are added.
+
+        Arguments
+        ---------
+
+          - `rows`: row of each value
+
+          - `columns`: column of each value
+
+          - `values`: values
+
+          - `shape`: number of rows and columns
+
+        Returns
+        -------
+
+          - `CSRMatrix`: sparse matrix
+        """
+        rows = np.asarray(rows,dtype=np.intp)
+        columns = np.asarray(columns,dtype=np.intp)
+        values = np.broadcast_to(np.asarray(values,dtype=float),rows.shape)
+        keys,inverse = np.unique(rows * shape[1] + columns,return_inverse=True)
+        data = np.bincount(inverse.ravel(),weights=values,minlength=len(keys))
+        indptr = np.searchsorted(keys // shape[1],np.arange(shape[0]+1))
+        return cls(data,keys % shape[1],indptr,shape)
+
+    @property
+    def nnz(self) -> int:
+        """Number of nonzero values"""
+        return len(self.data)
+
+    def __matmul__(self,other:np.ndarray) -> np.ndarray:
+        """Multiply by a dense array
+
+        Arguments
+        ---------
+
+          - `other`: array of shape `(columns,...)`
+
+        Returns
+        -------
+
+          - `np.ndarray`: array of shape `(rows,...)`
+        """
+        other = np.asarray(other)
+        if len(other) != self.shape[1]:
+            raise ValueError(f"cannot multiply {self.shape} matrix by {other.shape} array")
+        products = other[self.indices] * self.data.reshape((-1,)+(1,)*(other.ndim-1))
+        result = np.zeros((self.shape[0],)+other.shape[1:],dtype=products.dtype)
+        nonempty = np.flatnonzero(np.diff(self.indptr))
+        if nonempty.size:
+            result[nonempty] = np.add.reduceat(products,self.indptr[nonempty],axis=0)
+        return result
+
+    def toarray(self) -> np.ndarray:
+        """Convert to a dense array
+
+        Returns
+        -------
+
+          - `np.ndarray`: array of shape `shape`
+        """
+        result = np.zeros(self.shape)
+        result[np.repeat(np.arange(self.shape[0]),np.diff(self.indptr)),self.indices] = self.data
+        return result
+
+    def to_scipy(self) -> "scipy.sparse.csr_array":
+        """Convert to a SciPy sparse array
+
+        Returns
+        -------
+
+          - `scipy.sparse.csr_array`: sparse array, which requires SciPy
+        """
+        import scipy.sparse # pylint: disable=import-outside-toplevel,import-error
+        return scipy.sparse.csr_array((self.data,self.indices,self.indptr),shape=self.shape)
+
+    def __repr__(self):
+        return f"<CSRMatrix(shape={self.shape},nnz={self.nnz})>"
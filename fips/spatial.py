@@ -0,0 +1,325 @@
+"""Spatial indexing of geographic points
+
+Points are indexed as 3D unit vectors, so that distances are computed without
+trigonometry and without special handling of the poles and the antimeridian.
+The straight line (chord) distance between two unit vectors increases with
+the great circle distance between the points, so the nearest points by chord
+distance are also the nearest points on the earth's surface.
+
+Examples
+--------
+
+To find which of two points is nearest to Oakland CA use the command
+
+    from fips.spatial import KDTree, to_xyz, chord_to_km
+    tree = KDTree(to_xyz([37.6,34.1],[-121.9,-118.2]))
+    chord,index = tree.query(to_xyz(37.8,-122.3))
+    print(index,chord_to_km(chord))
+
+which outputs
+
+    [[0]] [[41.62991629]]
+"""
+
+import numpy as np
+
+EARTH_RADIUS = 6371.0088
+"""Mean earth radius (km)"""
+
+def to_xyz(lat:float|np.ndarray,lon:float|np.ndarray) -> np.ndarray:
+    """Convert latitudes and longitudes to unit vectors
+
+    Arguments
+    ---------
+
+      - `lat`: latitudes (degrees)
+
+      - `lon`: longitudes (degrees)
+
+    Returns
+    -------
+
+      - `np.ndarray`: unit vectors as an array of shape `(n,3)`
+    """
+    lat = np.radians(np.asarray(lat,dtype=float)).ravel()
+    lon = np.radians(np.asarray(lon,dtype=float)).ravel()
+    cos_lat = np.cos(lat)
+    return np.stack([cos_lat*np.cos(lon),cos_lat*np.sin(lon),np.sin(lat)],axis=1)
+
+def chord_to_km(chord:float|np.ndarray) -> float|np.ndarray:
+    """Convert chord distances between unit vectors to great circle distances
+
+    Arguments
+    ---------
+
+      - `chord`: chord distances
+
+    Returns
+    -------
+
+      - `float|np.ndarray`: great circle distances (km)
+    """
+    return 2 * EARTH_RADIUS * np.arcsin(np.clip(np.asarray(chord)/2,0,1))
+
+def km_to_chord(km:float|np.ndarray) -> float|np.ndarray:
+    """Convert great circle distances to chord distances between unit vectors
+
+    Arguments
+    ---------
+
+      - `km`: great circle distances (km)
+
+    Returns
+    -------
+
+      - `float|np.ndarray`: chord distances
+    """
+    return 2 * np.sin(np.clip(np.asarray(km)/EARTH_RADIUS,0,np.pi)/2)
+
+def haversine(
+    lat1:float|np.ndarray,
+    lon1:float|np.ndarray,
+    lat2:float|np.ndarray,
+    lon2:float|np.ndarray,
+    ) -> float|np.ndarray:
+    """Compute great circle distances between points
+
+    Arguments are broadcast against each other.
+
+    Arguments
+    ---------
+
+      - `lat1`, `lon1`: first points (degrees)
+
+      - `lat2`, `lon2`: second points (degrees)
+
+    Returns
+    -------
+
+      - `float|np.ndarray`: great circle distances (km)
+    """
+    lat1,lon1,lat2,lon2 = (np.radians(x) for x in (lat1,lon1,lat2,lon2))
+    h = np.sin((lat2-lat1)/2)**2 + np.cos(lat1)*np.cos(lat2)*np.sin((lon2-lon1)/2)**2
+    return 2 * EARTH_RADIUS * np.arcsin(np.sqrt(np.clip(h,0,1)))
+
+class KDTree:
+    """K-d tree of points
+
+    The tree recursively splits the points at the median of the dimension
+    with the largest spread until no more than `leafsize` points remain in
+    each leaf, and keeps the bounding box of each node. Queries are vectorized
+    across query points: each query point first descends to its own leaf for
+    an initial estimate, then the tree is traversed one level at a time for
+    all the query points together, descending only into the nodes whose
+    bounding box is close enough, and finally the leaves reached are searched
+    one leaf at a time for all the query points that reached them.
+    """
+    # pylint: disable=too-many-instance-attributes
+    def __init__(self,points:np.ndarray,leafsize:int=32,chunksize:int=262144):
+        """Construct a k-d tree
+
+        Arguments
+        ---------
+
+          - `points`: points as an array of shape `(n,d)`
+
+          - `leafsize`: maximum number of points in a leaf
+
+          - `chunksize`: maximum number of query points searched at once
+        """
+        self.points = np.array(points,dtype=float)
+        self.points.flags.writeable = False
+        self.chunksize = chunksize
+
+        order = []
+        nodes = [] # dim, split, left, right
+        leaves = [] # start, stop
+        members = {} # node -> points
+        def split(index):
+            if len(index) <= leafsize:
+                leaves.append((len(order),len(order)+len(index)))
+                order.extend(index)
+                members[~(len(leaves)-1)] = index
+                return ~(len(leaves)-1)
+            points = self.points[index]
+            dim = int(np.argmax(points.max(axis=0)-points.min(axis=0)))
+            index = index[np.argsort(points[:,dim],kind="stable")]
+            middle = len(index) // 2
+            node = len(nodes)
+            nodes.append([dim,self.points[index[middle-1],dim],0,0])
+            members[node] = index
+            nodes[node][2] = split(index[:middle])
+            nodes[node][3] = split(index[middle:])
+            return node
+        self._root = split(np.arange(len(self.points)))
+
+        table = np.array(nodes,dtype=float).reshape(-1,4)
+        self._dim = table[:,0].astype(np.intp)
+        self._split = table[:,1]
+        self._left = table[:,2].astype(np.intp)
+        self._right = table[:,3].astype(np.intp)
+        self._order = np.array(order,dtype=np.intp)
+        self._leaves = np.array(leaves,dtype=np.intp).reshape(-1,2)
+
+        # bounding boxes of internal nodes followed by leaves, by dimension
+        self._lower = np.empty((self.points.shape[1],len(nodes)+len(leaves)))
+        self._upper = np.empty((self.points.shape[1],len(nodes)+len(leaves)))
+        for node,index in members.items():
+            self._lower[:,self._box(node)] = self.points[index].min(axis=0)
+            self._upper[:,self._box(node)] = self.points[index].max(axis=0)
+        self._norm2 = (self.points**2).sum(axis=1)
+
+    def __len__(self):
+        return len(self.points)
+
+    def query(self,points:np.ndarray,k:int=1) -> tuple[np.ndarray,np.ndarray]:
+        """Find the nearest points
+
+        Arguments
+        ---------
+
+          - `points`: query points as an array of shape `(m,d)`
+
+          - `k`: number of nearest points to find
+
+        Returns
+        -------
+
+          - `np.ndarray`: distances as an array of shape `(m,k)`, in
+            increasing order
+
+          - `np.ndarray`: indexes of the nearest points as an array of shape
+            `(m,k)`
+        """
+        if k < 1:
+            raise ValueError(f"{k=} is not at least 1")
+        points = np.asarray(points,dtype=float).reshape(-1,self.points.shape[1])
+        k = min(k,len(self))
+        dist = np.empty((len(points),k))
+        index = np.empty((len(points),k),dtype=np.intp)
+        for start in range(0,len(points),self.chunksize):
+            stop = start + self.chunksize
+            dist[start:stop],index[start:stop] = self._query(points[start:stop],k)
+        return np.sqrt(dist),index
+
+    def query_radius(self,
+        points:np.ndarray,
+        radius:float|np.ndarray,
+        ) -> tuple[np.ndarray,np.ndarray,np.ndarray]:
+        """Find all the points within a distance
+
+        Arguments
+        ---------
+
+          - `points`: query points as an array of shape `(m,d)`
+
+          - `radius`: distance limit, for all query points or for each one
+
+        Returns
+        -------
+
+          - `np.ndarray`: query point index of each match, in increasing order
+
+          - `np.ndarray`: index of each matching point, in increasing order
+            for each query point
+
+          - `np.ndarray`: distance of each matching point
+        """
+        # pylint: disable=too-many-locals
+        points = np.asarray(points,dtype=float).reshape(-1,self.points.shape[1])
+        radius2 = np.broadcast_to(np.asarray(radius,dtype=float)**2,len(points))
+        # the traversal prunes strictly, so the limit is widened to include ties
+        queries,leaves = self._traverse(np.ascontiguousarray(points.T),np.nextafter(radius2,np.inf))
+        found = [(np.empty(0,dtype=np.intp),np.empty(0,dtype=np.intp),np.empty(0))]
+        for leaf,group in self._groups(leaves):
+            start,stop = self._leaves[leaf]
+            index = self._order[start:stop]
+            dist2 = self._distance(points[queries[group]],index)
+            query,match = np.nonzero(dist2 <= radius2[queries[group],None])
+            found.append((queries[group][query],index[match],dist2[query,match]))
+        queries,index,dist2 = (np.concatenate(x) for x in zip(*found))
+        order = np.lexsort((index,queries))
+        return queries[order],index[order],np.sqrt(dist2[order])
+
+    def _query(self,points,k):
+        # pylint: disable=too-many-locals
+        best = np.full((len(points),k),np.inf)
+        index = np.full((len(points),k),-1,dtype=np.intp)
+
+        # initial estimate from the leaf containing each query point
+        node = np.full(len(points),self._root,dtype=np.intp)
+        internal = np.flatnonzero(node >= 0)
+        while internal.size:
+            parent = node[internal]
+            left = points[internal,self._dim[parent]] <= self._split[parent]
+            node[internal] = np.where(left,self._left[parent],self._right[parent])
+            internal = internal[node[internal] >= 0]
+        home = ~node
+        for leaf,found in self._groups(home):
+            self._update(points,best,index,found,leaf)
+
+        # search other leaves that may contain nearer points
+        queries,leaves = self._traverse(np.ascontiguousarray(points.T),best[:,-1])
+        other = leaves != home[queries]
+        queries,leaves = queries[other],leaves[other]
+        for leaf,found in self._groups(leaves):
+            self._update(points,best,index,queries[found],leaf)
+
+        order = np.argsort(best,axis=1)
+        return np.take_along_axis(best,order,axis=1),np.take_along_axis(index,order,axis=1)
+
+    def _update(self,points,best,index,found,leaf):
+        start,stop = self._leaves[leaf]
+        candidates = self._order[start:stop]
+        dist2 = np.concatenate([best[found],self._distance(points[found],candidates)],axis=1)
+        candidates = np.concatenate([index[found],
+            np.broadcast_to(candidates,(len(found),len(candidates)))],axis=1)
+        k = best.shape[1]
+        if k == 1:
+            nearest = np.argmin(dist2,axis=1)[:,None]
+        else:
+            nearest = np.argpartition(dist2,k-1,axis=1)[:,:k]
+        best[found] = np.take_along_axis(dist2,nearest,axis=1)
+        index[found] = np.take_along_axis(candidates,nearest,axis=1)
+
+    def _traverse(self,points,limit2):
+        # find the leaves that may contain points within the squared distance
+        # limit of each query point (as columns), as (query point,leaf) pairs;
+        # the child on the query point's side of the split is always searched
+        # and the other child only if its bounding box is close enough
+        queries = np.arange(points.shape[1])
+        nodes = np.full(points.shape[1],self._root,dtype=np.intp)
+        found = [(np.empty(0,dtype=np.intp),np.empty(0,dtype=np.intp))]
+        while queries.size:
+            leaf = nodes < 0
+            found.append((queries[leaf],~nodes[leaf]))
+            queries,nodes = queries[~leaf],nodes[~leaf]
+            left = points[self._dim[nodes],queries] <= self._split[nodes]
+            near = np.where(left,self._left[nodes],self._right[nodes])
+            far = np.where(left,self._right[nodes],self._left[nodes])
+            box = self._box(far)
+            query = points[:,queries]
+            bound2 = (np.maximum(self._lower[:,box] - query,0)**2
+                + np.maximum(query - self._upper[:,box],0)**2).sum(axis=0)
+            keep = bound2 < limit2[queries]
+            queries = np.concatenate([queries,queries[keep]])
+            nodes = np.concatenate([near,far[keep]])
+        return tuple(np.concatenate(x) for x in zip(*found))
+
+    def _box(self,nodes):
+        return np.where(nodes >= 0,nodes,len(self._dim) + ~nodes)
+
+    def _distance(self,points,index):
+        # squared distances between points (as rows) and indexed points
+        dist2 = (points**2).sum(axis=1)[:,None] + self._norm2[index] \
+            - 2 * points @ self.points[index].T
+        return np.maximum(dist2,0)
+
+    @staticmethod
+    def _groups(leaves):
+        # iterate over the positions of each distinct leaf
+        order = np.argsort(leaves,kind="stable")
+        leaves = leaves[order]
+        starts = np.flatnonzero(np.diff(leaves,prepend=-1))
+        for start,stop in zip(starts,np.append(starts[1:],len(leaves))):
+            yield leaves[start],order[start:stop]
@@ -14,38 +14,120 @@ which outputs
 
 """
 
-import pandas as pd
+import functools
+
+__all__ = ["State","States","encode_fips","decode_fips"]
+
+def __getattr__(name):
+    # the states data frame requires pandas, so it is only loaded when used
+    if name == "States":
+        # pylint: disable=import-outside-toplevel,cyclic-import,redefined-outer-name
+        from fips._states import States
+        return States
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 class State:
+    # pylint: disable=no-member
     """Get state data
 
     See `States()` for list of available state data. 
     """
-    def __init__(self,**kwargs):
-        """Construct a single state data object
+    __slots__ = ("STATE","ST","FIPS","TZOFFSET","DST","SYSTEM","RO")
+
+    def __new__(cls,**kwargs):
+        """Get a single state data object
+
+        State data objects are immutable and interned, so equal search
+        criteria always return the same object, and objects compare and hash
+        by FIPS code.
 
         # Arguments
 
         - `**kwargs`: search criteria (e.g., `{ST="CA"}`)
         """
-        keys = list(kwargs.keys())
-        values = list(kwargs.values())
-
         try:
-            self.data = States(
-                with_territories=True,
-                with_canada=True,
-                with_mexico=True,
-                )\
-                .set_index(keys).loc[values]\
-                .reset_index()
-        except KeyError:
-            self.data = None
-        if self.data is None or len(self.data) > 1:
+            rows = _key_index(tuple(kwargs))[tuple(kwargs.values())]
+        except (KeyError,TypeError,ValueError):
+            rows = []
+        if len(rows) != 1:
             raise KeyError(f"{kwargs=} is not a valid unique key")
+        return _instance(rows[0])
+
+    @classmethod
+    def resolve(cls,value:str|int) -> "State":
+        """Get a single state data object from any state identifier
+
+        # Arguments
+
+        - `value`: state abbreviation (e.g., `"CA"`), FIPS code (e.g., `"06"`,
+          `"6"`, or `6`), or name (e.g., `"California"`), in any case
+
+        # Returns
+
+        - `State`: state data object
+        """
+        try:
+            return _instance(_resolver()[_resolver_key(value)])
+        except (KeyError,TypeError,ValueError) as err:
+            raise KeyError(f"{value=} is not a valid state identifier") from err
+
+    @classmethod
+    def resolve_many(cls,
+        values:"list|np.ndarray|pd.Series",
+        column:str="ST",
+        ) -> "np.ma.MaskedArray":
+        """Get state data for many state identifiers at once
+
+        # Arguments
+
+        - `values`: state identifiers of any kind accepted by `resolve()`,
+          which may be mixed
+
+        - `column`: state data to get (default is `"ST"`)
 
-    def __getattr__(self,key):
-        return self.data[key].iloc[0]
+        # Returns
+
+        - `np.ma.MaskedArray`: state data aligned with `values`, masked where
+          the identifier is unknown
+        """
+        # pylint: disable=import-outside-toplevel,redefined-outer-name
+        import numpy as np
+        import pandas as pd
+
+        codes,uniques = pd.factorize(np.asarray(values,dtype=object))
+        rows = []
+        for value in uniques:
+            try:
+                rows.append(_resolver()[_resolver_key(value)])
+            except (KeyError,TypeError,ValueError):
+                rows.append(-1)
+        rows = np.array(rows + [-1],dtype=np.int16)[codes]
+        mask = rows < 0
+        data = np.array([x[cls.__slots__.index(column)] for x in _records()],dtype=object)
+        return np.ma.MaskedArray(data.take(np.where(mask,0,rows)),mask=mask)
+
+    def __setattr__(self,key,value):
+        raise AttributeError(f"{type(self).__name__} objects are immutable")
+
+    def __delattr__(self,key):
+        raise AttributeError(f"{type(self).__name__} objects are immutable")
+
+    def __eq__(self,other):
+        if not isinstance(other,State):
+            return NotImplemented
+        return self.FIPS == other.FIPS
+
+    def __hash__(self):
+        return hash(self.FIPS)
+
+    def __reduce__(self):
+        return (_from_fips,(self.FIPS,))
+
+    @property
+    def data(self) -> "pd.DataFrame":
+        """One-row data frame of the state data"""
+        import pandas as pd # pylint: disable=import-outside-toplevel,redefined-outer-name
+        return pd.DataFrame([self.to_dict()])
 
     def __str__(self):
         return f"{self.STATE}"
@@ -55,143 +137,254 @@ class State:
 
     def to_dict(self):
         """Convert state data object to dict"""
-        return {x:y[0] for x,y in self.data.to_dict('list').items()}
+        return {x:getattr(self,x) for x in self.__slots__}
 
 
-class States(pd.DataFrame):
-    """US states dataframe
+_FIPS_PREFIXES = {"C":100,"M":110}
+"""Integer code offsets of non-numeric state FIPS code prefixes"""
 
-    Columns
-    -------
+def encode_fips(fips:"list[str]|np.ndarray|pd.Series") -> "np.ndarray":
+    """Convert state FIPS codes to integer codes
 
-      - `STATE`: state name
+    Numeric FIPS codes are converted to their integer value. Canadian (`"C0"`
+    to `"C9"`) and Mexican (`"M0"`) codes are offset according to their prefix
+    (e.g., `"C6"` is `106`).
 
-      - `ST`: state abbreviation
+    Arguments
+    ---------
 
-      - `FIPS`: state FIPS code
+      - `fips`: state FIPS codes (e.g., `["06","C6"]`)
+
+    Returns
+    -------
 
-      - `TZOFFSET`: state timezone offset
+      - `np.ndarray`: `int8` state FIPS codes
+    """
+    import numpy as np # pylint: disable=import-outside-toplevel
+    fips = np.asarray(fips,dtype=str)
+    if (np.char.str_len(fips) != 2).any():
+        raise ValueError(f"{fips=} contains invalid state FIPS codes")
+    chars = fips.astype("U2").view(np.uint32).reshape(-1,2).astype(np.int64)
+    chars[:,1] -= ord("0")
+    if ((chars[:,1] < 0) | (chars[:,1] > 9)).any():
+        raise ValueError(f"{fips=} contains invalid state FIPS codes")
+    codes = np.full(len(chars),-1,dtype=np.int16)
+    digits = (chars[:,0] >= ord("0")) & (chars[:,0] <= ord("9"))
+    codes[digits] = (chars[digits,0] - ord("0")) * 10 + chars[digits,1]
+    for prefix,offset in _FIPS_PREFIXES.items():
+        found = chars[:,0] == ord(prefix)
+        codes[found] = offset + chars[found,1]
+    if (codes < 0).any():
+        raise ValueError(f"{fips=} contains invalid state FIPS codes")
+    return codes.astype(np.int8)
+
+def decode_fips(codes:"list[int]|np.ndarray|pd.Series") -> "np.ndarray":
+    """Convert integer codes to state FIPS codes
+
+    This is the inverse of `encode_fips()`.
+
+    Arguments
+    ---------
+
+      - `codes`: integer state FIPS codes (e.g., `[6,106]`)
+
+    Returns
+    -------
+
+      - `np.ndarray`: state FIPS code strings
+    """
+    import numpy as np # pylint: disable=import-outside-toplevel
+    codes = np.asarray(codes,dtype=np.int16).ravel()
+    if ((codes < 0) | (codes >= max(_FIPS_PREFIXES.values()) + 10)).any():
+        raise ValueError(f"{codes=} contains invalid state FIPS codes")
+    chars = np.empty((len(codes),2),dtype=np.uint8)
+    chars[:,0] = ord("0") + codes // 10
+    chars[:,1] = ord("0") + codes % 10
+    for prefix,offset in _FIPS_PREFIXES.items():
+        found = (codes >= offset) & (codes < offset + 10)
+        chars[found,0] = ord(prefix)
+    return chars.view("S2").ravel().astype(str)
+
+@functools.cache
+def _records() -> tuple[tuple]:
+    """Get the state data records
+
+    The records are built once per process, with one tuple of native Python
+    values per state, territory, and province in the order of
+    `State.__slots__`.
+
+    Returns
+    -------
 
-      - `DST`: flag to indicate whether summer time is observed
+      - `tuple[tuple]`: state data records
+    """
+    columns = [_COLUMNS.index(x) for x in State.__slots__]
+    return tuple(tuple(x[n] for n in columns)
+        for x in _STATES + _TERRITORIES + _CANADA + _MEXICO)
 
-      - `SYSTEM`: system interconnection name
+@functools.cache
+def _instance(row:int) -> State:
+    """Get the interned state data object of a record
 
-      - `RO`: reliability organization name(s), split using `"|"`
+    Arguments
+    ---------
 
-    Caveat
-    ------
+      - `row`: record position
 
-      - Time zones and summer time are not uniformly observed in some states.
-        See `fips.counties.Counties` for a more granular determination of
-        these values.
+    Returns
+    -------
 
-      - Some states are in multiple systems and/or have multiple reliability
-        organizations. In such cases only the system that covers the major
-        population center(s) is provided, but the reliability organizations
-        are all listed, seperated by `"|"`.
+      - `State`: state data object
     """
-    def __init__(self,
-        with_territories:bool=False,
-        with_canada:bool=False,
-        with_mexico:bool=False,
-        use_index:str|list[str]=None
-        ):
-        """Construct states data frame
+    instance = object.__new__(State)
+    for key,value in zip(State.__slots__,_records()[row]):
+        object.__setattr__(instance,key,value)
+    return instance
 
-        Arguments
-        ---------
+@functools.cache
+def _resolver() -> dict[str,int]:
+    """Get the state identifier index
 
-          - `with_territories`: append US territories (PR and VI)
+    The index is built once per process and maps the upper case abbreviation,
+    FIPS code, unpadded numeric FIPS code, and name of each state to its
+    record position.
 
-          - `with_canada`: append Canadian provinces (provinces listed
-            under "STATE"--sorry)
+    Returns
+    -------
 
-          - `with_mexico`: append Baja California (listed under "STATE" as
-            `"MEXICO"`)
+      - `dict[str,int]`: record position of each state identifier
+    """
+    index = {}
+    for row,record in enumerate(_records()):
+        fields = dict(zip(State.__slots__,record))
+        index[fields["ST"].upper()] = row
+        index[fields["FIPS"].upper()] = row
+        index[fields["STATE"].upper()] = row
+        if fields["FIPS"].isdigit():
+            index[str(int(fields["FIPS"]))] = row
+    return index
+
+def _resolver_key(value:str|int) -> str:
+    """Get the state identifier index key of a value"""
+    if isinstance(value,float) and value.is_integer():
+        value = int(value)
+    return str(value).strip().upper()
+
+def _from_fips(fips:str) -> State:
+    """Get the interned state data object of a FIPS code (used for pickling)"""
+    return State(FIPS=fips)
+
+@functools.cache
+def _key_index(keys:tuple[str]) -> dict[tuple,list[int]]:
+    """Get a state data index over a set of columns
+
+    Each index is built once per process the first time the set of columns
+    is used as a search criterion.
+
+    Arguments
+    ---------
+
+      - `keys`: column names
+
+    Returns
+    -------
 
-          - `use_index`: specify index to initially set
-        """
-        data = pd.DataFrame(
-            columns=["STATE","ST","FIPS","TZOFFSET","DST","SYSTEM","RO"],
-            data=[
-                ["Alabama","AL","01",-6.0,1,"EAST","SERC"],
-                ["Alaska","AK","02",-9.0,1,"AK","NERC"],
-                ["Arizona","AZ","04",-7.0,0,"WECC","WECC"],
-                ["Arkansas","AR","05",-6.0,1,"EAST","SERC"],
-                ["California","CA","06",-8.0,1,"WECC","WECC"],
-                ["Colorado","CO","08",-7.0,1,"WECC","WECC"],
-                ["Connecticut","CT","09",-5.0,1,"EAST","NPCC"],
-                ["Delaware","DE","10",-5.0,1,"EAST","RF"],
-                ["District of Columbia","DC","11",-5.0,1,"EAST","RF"],
-                ["Florida","FL","12",-5.0,1,"EAST","SERC"],
-                ["Georgia","GA","13",-5.0,1,"EAST","SERC"],
-                ["Hawaii","HI","15",-9.0,0,"HI","NERC"],
-                ["Idaho","ID","16",-7.0,1,"WECC","WECC"],
-                ["Illinois","IL","17",-6.0,1,"EAST","SERC|RF|MRO"],
-                ["Indiana","IN","18",-5.0,1,"EAST","RF"],
-                ["Iowa","IA","19",-6.0,1,"EAST","MRO"],
-                ["Kansas","KS","20",-6.0,1,"EAST","MRO"],
-                ["Kentucky","KY","21",-6.0,1,"EAST","SERC"],
-                ["Louisiana","LA","22",-6.0,1,"EAST","SERC"],
-                ["Maine","ME","23",-5.0,1,"EAST","NPCC"],
-                ["Maryland","MD","24",-5.0,1,"EAST","RF"],
-                ["Massachusetts","MA","25",-5.0,1,"EAST","NPCC"],
-                ["Michigan","MI","26",-5.0,1,"EAST","RF|MRO"],
-                ["Minnesota","MN","27",-6.0,1,"EAST","MRO"],
-                ["Mississippi","MS","28",-6.0,1,"EAST","SERC"],
-                ["Missouri","MO","29",-6.0,1,"EAST","SERC|MRO"],
-                ["Montana","MT","30",-7.0,1,"WECC","WECC|MRO"],
-                ["Nebraska","NE","31",-6.0,1,"EAST","MRO"],
-                ["Nevada","NV","32",-7.0,1,"WECC","WECC"],
-                ["New Hampshire","NH","33",-5.0,1,"EAST","NPCC"],
-                ["New Jersey","NJ","34",-5.0,1,"EAST","RF"],
-                ["New Mexico","NM","35",-7.0,1,"WECC","WECC|MRO"],
-                ["New York","NY","36",-5.0,1,"EAST","NPCC"],
-                ["North Carolina","NC","37",-5.0,1,"EAST","SERC"],
-                ["North Dakota","ND","38",-6.0,1,"EAST","MRO"],
-                ["Ohio","OH","39",-5.0,1,"EAST","RF"],
-                ["Oklahoma","OK","40",-6.0,1,"EAST","MRO|SERC"],
-                ["Oregon","OR","41",-8.0,1,"WECC","WECC"],
-                ["Pennsylvania","PA","42",-5.0,1,"EAST","RF"],
-                ["Rhode Island","RI","44",-5.0,1,"EAST","NPCC"],
-                ["South Carolina","SC","45",-5.0,1,"EAST","SERC"],
-                ["South Dakota","SD","46",-6.0,1,"EAST","MRO|WECC"],
-                ["Tennessee","TN","47",-6.0,1,"EAST","SERC"],
-                ["Texas","TX","48",-6.0,1,"ERCOT","TRE|MRO|WECC"],
-                ["Utah","UT","49",-7.0,1,"WECC","WECC"],
-                ["Vermont","VT","50",-5.0,1,"EAST","NPCC"],
-                ["Virginia","VA","51",-5.0,1,"EAST","SERC|RF"],
-                ["Washington","WA","53",-8.0,1,"WECC","WECC"],
-                ["West Virginia","WV","54",-5.0,1,"EAST","RF"],
-                ["Wisconsin","WI","55",-6.0,1,"EAST","MRO|RF"],
-                ["Wyoming","WY","56",-7.0,1,"WECC","WECC"],
-            ] + ([
-                ["Puerto Rico","PR","72",-4,0,"PR","PR"],
-                ["Virgin Islands","VI","78",-4,0,"VI","VI"],
-                ] if with_territories else []
-            ) + ([
-                ["Alberta","AB","C0",-7.0,1,"WECC","WECC"],
-                ["British Columbia","BC","C1",-8.0,1,"WECC","WECC"],
-                ["Manitoba","MB","C2",-6.0,1,"EAST","MRO"],
-                ["New Brunswick","NB","C3",-4.0,1,"EAST","NPCC"],
-                ["Newfoundland","NL","C4",-3.5,1,"EAST","NPCC"],
-                ["Nova Scotia","NS","C5",-4.0,1,"EAST","NPCC"],
-                ["Ontario","ON","C6",-5.0,1,"EAST","NPCC"],
-                ["Prince Edward Island","PE","C7",-4.0,1,"EAST","NPCC"],
-                ["Quebec","QC","C8",-5.0,1,"QUEBEC","NPCC"],
-                ["Saskatchewan","SK","C9",-6.0,1,"EAST","MRO"],
-            ] if with_canada else []
-            ) + ([
-                ["Mexico","MX","M0",-8.0,1,"WECC","WECC|MFEC"],
-                ] if with_mexico else []
-            ),
-        )
-        if use_index:
-            data.set_index(use_index,inplace=True)
-        super().__init__(data.sort_index())
+      - `dict[tuple,list[int]]`: record positions of each key value
+    """
+    columns = [State.__slots__.index(x) for x in keys]
+    index = {}
+    for row,record in enumerate(_records()):
+        index.setdefault(tuple(record[x] for x in columns),[]).append(row)
+    return index
+
+_COLUMNS = ["STATE","ST","FIPS","TZOFFSET","DST","SYSTEM","RO"]
+"""States data columns"""
+
+_STATES = [
+    ["Alabama","AL","01",-6.0,1,"EAST","SERC"],
+    ["Alaska","AK","02",-9.0,1,"AK","NERC"],
+    ["Arizona","AZ","04",-7.0,0,"WECC","WECC"],
+    ["Arkansas","AR","05",-6.0,1,"EAST","SERC"],
+    ["California","CA","06",-8.0,1,"WECC","WECC"],
+    ["Colorado","CO","08",-7.0,1,"WECC","WECC"],
+    ["Connecticut","CT","09",-5.0,1,"EAST","NPCC"],
+    ["Delaware","DE","10",-5.0,1,"EAST","RF"],
+    ["District of Columbia","DC","11",-5.0,1,"EAST","RF"],
+    ["Florida","FL","12",-5.0,1,"EAST","SERC"],
+    ["Georgia","GA","13",-5.0,1,"EAST","SERC"],
+    ["Hawaii","HI","15",-9.0,0,"HI","NERC"],
+    ["Idaho","ID","16",-7.0,1,"WECC","WECC"],
+    ["Illinois","IL","17",-6.0,1,"EAST","SERC|RF|MRO"],
+    ["Indiana","IN","18",-5.0,1,"EAST","RF"],
+    ["Iowa","IA","19",-6.0,1,"EAST","MRO"],
+    ["Kansas","KS","20",-6.0,1,"EAST","MRO"],
+    ["Kentucky","KY","21",-6.0,1,"EAST","SERC"],
+    ["Louisiana","LA","22",-6.0,1,"EAST","SERC"],
+    ["Maine","ME","23",-5.0,1,"EAST","NPCC"],
+    ["Maryland","MD","24",-5.0,1,"EAST","RF"],
+    ["Massachusetts","MA","25",-5.0,1,"EAST","NPCC"],
+    ["Michigan","MI","26",-5.0,1,"EAST","RF|MRO"],
+    ["Minnesota","MN","27",-6.0,1,"EAST","MRO"],
+    ["Mississippi","MS","28",-6.0,1,"EAST","SERC"],
+    ["Missouri","MO","29",-6.0,1,"EAST","SERC|MRO"],
+    ["Montana","MT","30",-7.0,1,"WECC","WECC|MRO"],
+    ["Nebraska","NE","31",-6.0,1,"EAST","MRO"],
+    ["Nevada","NV","32",-7.0,1,"WECC","WECC"],
+    ["New Hampshire","NH","33",-5.0,1,"EAST","NPCC"],
+    ["New Jersey","NJ","34",-5.0,1,"EAST","RF"],
+    ["New Mexico","NM","35",-7.0,1,"WECC","WECC|MRO"],
+    ["New York","NY","36",-5.0,1,"EAST","NPCC"],
+    ["North Carolina","NC","37",-5.0,1,"EAST","SERC"],
+    ["North Dakota","ND","38",-6.0,1,"EAST","MRO"],
+    ["Ohio","OH","39",-5.0,1,"EAST","RF"],
+    ["Oklahoma","OK","40",-6.0,1,"EAST","MRO|SERC"],
+    ["Oregon","OR","41",-8.0,1,"WECC","WECC"],
+    ["Pennsylvania","PA","42",-5.0,1,"EAST","RF"],
+    ["Rhode Island","RI","44",-5.0,1,"EAST","NPCC"],
+    ["South Carolina","SC","45",-5.0,1,"EAST","SERC"],
+    ["South Dakota","SD","46",-6.0,1,"EAST","MRO|WECC"],
+    ["Tennessee","TN","47",-6.0,1,"EAST","SERC"],
+    ["Texas","TX","48",-6.0,1,"ERCOT","TRE|MRO|WECC"],
+    ["Utah","UT","49",-7.0,1,"WECC","WECC"],
+    ["Vermont","VT","50",-5.0,1,"EAST","NPCC"],
+    ["Virginia","VA","51",-5.0,1,"EAST","SERC|RF"],
+    ["Washington","WA","53",-8.0,1,"WECC","WECC"],
+    ["West Virginia","WV","54",-5.0,1,"EAST","RF"],
+    ["Wisconsin","WI","55",-6.0,1,"EAST","MRO|RF"],
+    ["Wyoming","WY","56",-7.0,1,"WECC","WECC"],
+]
+"""US states data"""
+
+_TERRITORIES = [
+    ["Puerto Rico","PR","72",-4.0,0,"PR","PR"],
+    ["Virgin Islands","VI","78",-4.0,0,"VI","VI"],
+]
+"""US territories data"""
+
+_CANADA = [
+    ["Alberta","AB","C0",-7.0,1,"WECC","WECC"],
+    ["British Columbia","BC","C1",-8.0,1,"WECC","WECC"],
+    ["Manitoba","MB","C2",-6.0,1,"EAST","MRO"],
+    ["New Brunswick","NB","C3",-4.0,1,"EAST","NPCC"],
+    ["Newfoundland","NL","C4",-3.5,1,"EAST","NPCC"],
+    ["Nova Scotia","NS","C5",-4.0,1,"EAST","NPCC"],
+    ["Ontario","ON","C6",-5.0,1,"EAST","NPCC"],
+    ["Prince Edward Island","PE","C7",-4.0,1,"EAST","NPCC"],
+    ["Quebec","QC","C8",-5.0,1,"QUEBEC","NPCC"],
+    ["Saskatchewan","SK","C9",-6.0,1,"EAST","MRO"],
+]
+"""Canadian provinces data"""
+
+_MEXICO = [
+    ["Mexico","MX","M0",-8.0,1,"WECC","WECC|MFEC"],
+]
+"""Mexican states data"""
 
 if __name__ == '__main__':
 
+    import pandas as pd
+    from fips._states import States
+
     pd.options.display.width = None
     pd.options.display.max_rows = None
     pd.options.display.max_columns = None
@@ -1,7 +1,23 @@
 """Run FIPS tests"""
 
+import datetime as dt
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
 import unittest
+import unittest.mock
+import zoneinfo
+import warnings
+import numpy as np
+import pandas as pd
 import fips
+import fips._cache
+import fips.geohash
+import fips.localtime
+import fips.sparse
+import fips.spatial
 
 class TestStates(unittest.TestCase):
 
@@ -80,5 +96,446 @@ class TestStates(unittest.TestCase):
         self.assertEqual(test.SYSTEM,"WECC")
         self.assertEqual(test.RO,"WECC")
 
+    def test_states_kinds(self):
+        self.assertEqual(len(fips.states.States()),51)
+        self.assertEqual(len(fips.states.States(with_territories=True)),53)
+        self.assertEqual(fips.states.States(with_mexico=True).ST.tolist()[-1],"MX")
+        test = fips.states.States(with_canada=True,use_index="ST")
+        self.assertEqual(len(test),61)
+        self.assertNotIn("KIND",test.columns)
+        test.loc["CA","FIPS"] = "99"
+        self.assertEqual(fips.states.States(use_index="ST").loc["CA","FIPS"],"06")
+
+    def test_state_resolve(self):
+        test = fips.states.State(ST="CA")
+        for value in ["CA","ca","06","6",6,6.0,"california"," California "]:
+            self.assertIs(fips.states.State.resolve(value),test)
+        self.assertEqual(fips.states.State.resolve("c8").STATE,"Quebec")
+        with self.assertRaises(KeyError):
+            fips.states.State.resolve("Atlantis")
+        test = fips.states.State.resolve_many(["CA",6,"Nevada","ZZ",None,"32"])
+        self.assertEqual(test.tolist(),["CA","CA","NV",None,None,"NV"])
+
+    def test_state_record(self):
+        test = fips.states.State(ST="QC")
+        self.assertFalse(hasattr(test,"__dict__"))
+        self.assertEqual(test.to_dict(),{
+            "STATE":"Quebec","ST":"QC","FIPS":"C8","TZOFFSET":-5.0,
+            "DST":1,"SYSTEM":"QUEBEC","RO":"NPCC",
+            })
+
+    def test_state_interned(self):
+        test = fips.states.State(ST="CA")
+        self.assertIs(test,fips.states.State(FIPS="06"))
+        self.assertIs(test,pickle.loads(pickle.dumps(test)))
+        self.assertEqual(len({test,fips.states.State(STATE="California")}),1)
+        with self.assertRaises(AttributeError):
+            test.ST = "NV"
+
+    def test_states_FIPSCODE(self):
+        test = fips.states.States(with_canada=True,with_mexico=True)
+        self.assertEqual(test.FIPSCODE.dtype,"int8")
+        self.assertEqual(test.set_index("ST").loc[["CA","ON","MX"],"FIPSCODE"].tolist(),[6,106,110])
+        self.assertEqual(fips.states.decode_fips(test.FIPSCODE).tolist(),test.FIPS.tolist())
+        for invalid in ["X1","061","0612","6","0٦","C٦"]:
+            with self.assertRaises(ValueError):
+                fips.states.encode_fips([invalid])
+
+class TestCounties(unittest.TestCase):
+
+    def test_counties_shared(self):
+        test = fips.counties.Counties()
+        test.loc[0,"COUNTY"] = "Modified"
+        test.set_index("FIPS",inplace=True)
+        self.assertEqual(fips.counties.Counties().loc[0,"COUNTY"],"Autauga")
+        self.assertEqual(fips.counties.County(ST="AL",COUNTY="Autauga").FIPS,"01001")
+
+    def test_county_FIPS(self):
+        test = fips.counties.County.from_fips("06001")
+        self.assertEqual(test.ST,"CA")
+        self.assertEqual(test.COUNTY,"Alameda")
+        self.assertEqual(test.to_dict(),fips.counties.County(FIPS="06001").to_dict())
+        with self.assertRaises(KeyError):
+            fips.counties.County.from_fips("99999")
+
+    def test_county_record(self):
+        test = fips.counties.County(ST="CA",COUNTY="Alameda")
+        self.assertFalse(hasattr(test,"__dict__"))
+        self.assertEqual(test.to_dict(),{
+            "ST":"CA","FIPS":"06001","COUNTY":"Alameda","LAT":37.647139,
+            "LON":-121.912488,"GEOHASH":"9q9q1v","TZOFFSET":-8.0,"DST":1,
+            "SYSTEM":"WECC","RO":"WECC",
+            })
+        with self.assertRaises(KeyError):
+            fips.counties.County(ST="MD",COUNTY="Baltimore")
+
+    def test_county_interned(self):
+        test = fips.counties.County(ST="CA",COUNTY="Alameda")
+        self.assertIs(test,fips.counties.County.from_fips("06001"))
+        self.assertIs(test,pickle.loads(pickle.dumps(test)))
+        self.assertEqual({test:1}[fips.counties.County(FIPS="06001")],1)
+        self.assertNotEqual(test,fips.counties.County(FIPS="06003"))
+        with self.assertRaises(AttributeError):
+            test.COUNTY = "Oakland"
+
+    def test_counties_lookup_many(self):
+        test = fips.counties.Counties.lookup_many(
+            ["06001","99999","56045"],
+            columns=["ST","LAT","DST"],
+            )
+        self.assertEqual(list(test),["ST","LAT","DST"])
+        self.assertEqual(test["ST"].tolist(),["CA",None,"WY"])
+        self.assertEqual(test["DST"].mask.tolist(),[False,True,False])
+        self.assertAlmostEqual(test["LAT"][0],37.647139)
+
+    def test_counties_FIPSCODE(self):
+        test = fips.counties.Counties()
+        self.assertEqual(test.FIPSCODE.dtype,"int32")
+        self.assertEqual(test.STATECODE.dtype,"int8")
+        self.assertEqual(test.set_index("FIPS").loc["06001",["FIPSCODE","STATECODE"]].tolist(),[6001,6])
+        self.assertEqual(fips.counties.decode_fips(test.FIPSCODE).tolist(),test.FIPS.tolist())
+        for invalid in ["060011","6001","06O01"]:
+            with self.assertRaises(ValueError):
+                fips.counties.encode_fips([invalid])
+        self.assertEqual(fips.counties.Counties.lookup_many([6001,1])["COUNTY"].tolist(),["Alameda",None])
+        for codes in [pd.Series([6001,None],dtype="Int64"),np.array([6001.0,np.nan]),[6001.0,6001.5]]:
+            self.assertEqual(fips.counties.Counties.lookup_many(codes)["COUNTY"].tolist(),["Alameda",None])
+
+    def test_counties_snapshot(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            test = fips.counties._read_snapshot()
+        self.assertEqual(test,fips.counties._read_csv())
+
+    def test_counties_snapshot_derived(self):
+        zones = dict(fips.counties._TIMEZONE_COUNTIES)
+        zones[("06001",-8.0,1)] = "America/Tijuana"
+        with unittest.mock.patch.object(fips.counties,"_TIMEZONE_COUNTIES",zones):
+            with self.assertRaises(ValueError):
+                fips.counties._read_snapshot()
+
+    def test_counties_snapshot_truncated(self):
+        with open(fips.counties._SNAPSHOT_PATH,"rb") as fh:
+            buffer = fh.read()
+        with tempfile.TemporaryDirectory() as folder:
+            pathname = os.path.join(folder,"counties.dat")
+            for size in [0,18,100,len(buffer)//2,len(buffer)-1]:
+                with open(pathname,"wb") as fh:
+                    fh.write(buffer[:size])
+                with self.assertRaises(ValueError):
+                    fips.counties._read_snapshot(pathname)
+                with unittest.mock.patch.object(fips.counties,"_SNAPSHOT_PATH",pathname), \
+                        self.assertWarns(UserWarning):
+                    self.assertEqual(fips.counties._columns.__wrapped__(),fips.counties._read_csv())
+
+    def test_counties_nearest(self):
+        test = fips.counties.Counties.nearest(37.65,-121.91,k=3)
+        self.assertEqual(test.FIPS.iloc[0],"06001")
+        self.assertLess(test.DISTANCE.iloc[0],1)
+        self.assertTrue(test.DISTANCE.is_monotonic_increasing)
+        with self.assertRaises(ValueError):
+            fips.counties.Counties.nearest(37.65,-121.91,k=0)
+        with self.assertRaises(ValueError):
+            fips.counties.Counties.nearest_many([37.65],[-121.91],k=0)
+        with self.assertRaises(ValueError):
+            fips.counties.Counties.nearest(np.nan,0)
+        with self.assertRaises(ValueError):
+            fips.counties.Counties.nearest_many([37.65,np.nan],[-121.91,0.0])
+        with self.assertRaises(ValueError):
+            fips.counties.Counties.nearest_many([37.65],[np.inf])
+        lat = [37.8044,40.7128,21.3069,64.8378]
+        lon = [-122.2712,-74.0060,-157.8583,-147.7164]
+        fips_codes,distance = fips.counties.Counties.nearest_many(lat,lon)
+        data = fips.counties.Counties()
+        brute = [data.FIPS[fips.spatial.haversine(x,y,data.LAT,data.LON).argmin()]
+            for x,y in zip(lat,lon)]
+        self.assertEqual(fips_codes.tolist(),brute)
+        self.assertTrue((distance < 100).all())
+        fips_codes,distance = fips.counties.Counties.nearest_many(lat,lon,k=2)
+        self.assertEqual(fips_codes.shape,(4,2))
+
+    def test_counties_within_radius(self):
+        data = fips.counties.Counties()
+        test = fips.counties.Counties.within_radius(37.65,-121.91,100)
+        distance = fips.spatial.haversine(37.65,-121.91,data.LAT,data.LON)
+        self.assertEqual(sorted(test.FIPS),sorted(data.FIPS[distance <= 100]))
+        self.assertTrue(test.DISTANCE.is_monotonic_increasing)
+        queries,fips_codes,distance = fips.counties.Counties.within_radius_many(
+            [37.65,0.0,40.71],[-121.91,0.0,-74.01],[100,100,50])
+        self.assertEqual(set(queries),{0,2})
+        self.assertEqual(sorted(fips_codes[queries==0]),sorted(test.FIPS))
+        self.assertTrue((distance <= 100).all())
+
+    def test_counties_within_bbox(self):
+        data = fips.counties.Counties()
+        test = fips.counties.Counties.within_bbox(37,-123,38,-121)
+        inside = data.LAT.between(37,38) & data.LON.between(-123,-121)
+        self.assertEqual(test.FIPS.tolist(),data.FIPS[inside].tolist())
+        queries,fips_codes = fips.counties.Counties.within_bbox_many(
+            [37,50,51],[-123,0,170],[38,51,53],[-121,1,-170])
+        self.assertEqual(fips_codes[queries==0].tolist(),test.FIPS.tolist())
+        self.assertEqual(fips_codes[queries==2].tolist(),["02016"])
+
+    def test_counties_by_geohash_prefix(self):
+        data = fips.counties.Counties()
+        test = fips.counties.Counties.by_geohash_prefix("9q9")
+        self.assertEqual(sorted(test.FIPS),sorted(data.FIPS[data.GEOHASH.str.startswith("9q9")]))
+        self.assertTrue(test.GEOHASH.is_monotonic_increasing)
+        queries,fips_codes = fips.counties.Counties.by_geohash_prefix_many(["9q9","zzz","9Q9Q1"])
+        self.assertEqual(fips_codes[queries==0].tolist(),test.FIPS.tolist())
+        self.assertEqual(fips_codes[queries==2].tolist(),["06001"])
+        self.assertNotIn(1,queries)
+
+    def test_counties_distance_matrix(self):
+        from fips._counties import _distance_matrix # pylint: disable=import-outside-toplevel
+        data = fips.counties.Counties()
+        with tempfile.TemporaryDirectory() as cache, \
+                unittest.mock.patch.dict(os.environ,{"FIPS_CACHE_DIR":cache}):
+            _distance_matrix.cache_clear()
+            test = fips.counties.Counties.distance_matrix()
+            self.assertEqual(os.listdir(cache),[os.path.basename(fips._cache.cache_dir())])
+            self.assertIsInstance(test,np.memmap)
+            self.assertEqual(test.dtype,np.float32)
+            self.assertFalse(test.flags.writeable)
+            self.assertTrue(np.allclose(test[1],fips.spatial.haversine(
+                data.LAT[1],data.LON[1],data.LAT,data.LON),atol=1e-2))
+            self.assertTrue((test == test.T).all())
+            del test
+            _distance_matrix.cache_clear()
+
+    def test_counties_raster(self):
+        from fips._counties import _raster # pylint: disable=import-outside-toplevel
+        with tempfile.TemporaryDirectory() as cache, \
+                unittest.mock.patch.dict(os.environ,{"FIPS_CACHE_DIR":cache}):
+            _raster.cache_clear()
+            rasters = fips.counties.Counties.raster(0.5)
+            self.assertEqual({x.dtype for x in rasters.values()},{np.dtype("uint16")})
+            self.assertEqual(rasters["CONUS"].shape,(52,118))
+            lat,lon = np.meshgrid(24.25+np.arange(52)*0.5,-124.75+np.arange(118)*0.5,indexing="ij")
+            lat,lon = np.append(lat.ravel(),[0.0,37.65]),np.append(lon.ravel(),[0.0,-121.91])
+            test = fips.counties.Counties.locate_many(lat,lon,0.5)
+            self.assertEqual(test.tolist(),fips.counties.Counties.nearest_many(lat,lon)[0].tolist())
+            with self.assertRaises(ValueError):
+                fips.counties.Counties.locate_many([37.65,np.nan],[-121.91,0.0],0.5)
+            del rasters
+            _raster.cache_clear()
+
+    def test_counties_local_time(self):
+        utc = np.array(["2025-01-15T12:00","2025-07-15T12:00"],dtype="datetime64[s]")
+        test = fips.counties.Counties.utc_offset(utc[:,None],["06001","04003","02016","15001"])
+        self.assertEqual(test.tolist(),[[-8,-7,-10,-10],[-7,-7,-9,-10]])
+        test = fips.counties.Counties.local_time(utc,[6001,6001])
+        self.assertEqual(test.astype(str).tolist(),["2025-01-15T04:00:00","2025-07-15T05:00:00"])
+        with self.assertRaises(KeyError):
+            fips.counties.Counties.utc_offset(utc,["99999","06001"])
+        utc = np.array(["2025-07-15T12:00","NaT"],dtype="datetime64[s]")
+        test = fips.counties.Counties.utc_offset(utc,["06001","06001"])
+        self.assertEqual(test[0],-7)
+        self.assertTrue(np.isnan(test[1]))
+        test = fips.counties.Counties.local_time(utc,["06001","06001"])
+        self.assertEqual(test.astype(str).tolist(),["2025-07-15T05:00:00","NaT"])
+        self.assertTrue(np.isnan(fips.counties.Counties.utc_offset(utc[1:],["06001"])).all())
+
+    def test_counties_offset_calendar(self):
+        offsets,groups = fips.counties.Counties.offset_calendar(2024,2025)
+        self.assertEqual(offsets.dtype,np.int8)
+        self.assertEqual(offsets.shape,(8,(366+365)*24))
+        self.assertEqual(groups.shape,(3142,))
+        hours = np.arange(np.datetime64("2024-01-01T00","h"),np.datetime64("2026-01-01T00","h"))
+        test = ["06001","04003","02016","15001"]
+        rows = fips.counties.Counties().reset_index().set_index("FIPS").loc[test,"index"]
+        self.assertTrue((offsets[groups[rows]] ==
+            fips.counties.Counties.utc_offset(hours,np.array(test)[:,None])).all())
+        self.assertIs(fips.counties.Counties.offset_calendar(2025)[0],
+            fips.counties.Counties.offset_calendar(2025)[0])
+        with self.assertRaises(ValueError):
+            fips.counties.Counties.offset_calendar(2025,2024)
+
+    def test_counties_timezone(self):
+        data = fips.counties.Counties()
+        for name,group in data.groupby("TIMEZONE"):
+            zone = fips.counties.Counties.zoneinfo(group.FIPS.iloc[0])
+            self.assertEqual(zone.key,name)
+            winter = dt.datetime(2025,1,15,tzinfo=zone).utcoffset().total_seconds()/3600
+            summer = dt.datetime(2025,7,15,tzinfo=zone).utcoffset().total_seconds()/3600
+            self.assertEqual(set(group.TZOFFSET),{winter})
+            self.assertEqual(set(group.DST),{summer-winter})
+        self.assertIs(fips.counties.Counties.zoneinfo("06001"),fips.counties.Counties.zoneinfo("06003"))
+        utc = np.array(["2025-07-15T12:00","1990-07-15T12:00"],dtype="datetime64[s]")
+        test = fips.counties.Counties.zone_local_time(utc[:,None],["06001","18025"])
+        self.assertEqual(test.astype(str).tolist(),[["2025-07-15T05:00:00","2025-07-15T08:00:00"],
+            ["1990-07-15T05:00:00","1990-07-15T07:00:00"]])
+
+    def test_counties_rollup(self):
+        data = fips.counties.Counties()
+        values = np.arange(len(data)*3,dtype=float).reshape(-1,3)
+        for level in ["ST","SYSTEM","RO"]:
+            names,test = fips.counties.Counties.rollup(values,level)
+            expected = data[[level]].join(pd.DataFrame(values)).groupby(level).sum()
+            self.assertEqual(names.tolist(),expected.index.tolist())
+            self.assertTrue(np.allclose(test,expected.values))
+            self.assertTrue(np.allclose(fips.counties.Counties.rollup(values[:,1],level)[1],test[:,1]))
+        with self.assertRaises(ValueError):
+            fips.counties.Counties.rollup(values[1:],"ST")
+        counts = np.ones((len(data),2),dtype=np.int32)
+        self.assertEqual(fips.counties.Counties.rollup(counts,"ST")[1].dtype,counts.sum().dtype)
+        self.assertEqual(fips.counties.Counties.rollup(counts[:,0],"ST")[1].dtype,counts.sum().dtype)
+        self.assertEqual(fips.counties.Counties.rollup(counts[:,0] > 0,"ST")[1].sum(),len(data))
+
+    def test_counties_aggregation_matrix(self):
+        values = np.random.default_rng(0).random((3142,4))
+        for level in ["SYSTEM","RO"]:
+            names,matrix = fips.counties.Counties.aggregation_matrix(level)
+            self.assertEqual(matrix.shape,(len(names),3142))
+            expected = fips.counties.Counties.rollup(values,level)
+            self.assertEqual(names.tolist(),expected[0].tolist())
+            self.assertTrue(np.allclose(matrix @ values,expected[1]))
+        self.assertIs(fips.counties.Counties.aggregation_matrix("RO")[1],
+            fips.counties.Counties.aggregation_matrix("RO","equal")[1])
+        with self.assertRaises(ValueError):
+            fips.counties.Counties.aggregation_matrix("RO",{"WECC":1.0})
+
+    def test_counties_in_ro(self):
+        data = fips.counties.Counties()
+        test = fips.counties.Counties.in_ro("MRO")
+        self.assertEqual(test.FIPS.tolist(),data.FIPS[data.RO.str.split("|").apply(lambda x:"MRO" in x)].tolist())
+        with self.assertRaises(KeyError):
+            fips.counties.Counties.in_ro("XYZ")
+        self.assertEqual(fips.counties.Counties.in_ro_many(["06001","17031","17031"],["WECC","RF","XYZ"]).tolist(),
+            [True,True,False])
+        names,membership = fips.counties.Counties.ro_membership()
+        self.assertEqual(membership.shape,(len(data),len(names)))
+        self.assertEqual(membership[:,names.tolist().index("MRO")].sum(),len(test))
+
+    def test_counties_match(self):
+        data = fips.counties.Counties()
+        test = fips.counties.Counties.match(SYSTEM="WECC",TZOFFSET=[-8,-7],DST=1)
+        expected = data[(data.SYSTEM == "WECC") & data.TZOFFSET.isin([-8,-7]) & (data.DST == 1)]
+        self.assertEqual(test.FIPS.tolist(),expected.FIPS.tolist())
+        self.assertEqual(len(fips.counties.Counties.match(RO=np.array(["MRO","TRE"]))),
+            len(fips.counties.Counties.in_ro("MRO"))+len(fips.counties.Counties.in_ro("TRE")))
+        self.assertEqual(len(fips.counties.Counties.match(ST="CA",SYSTEM="EAST")),0)
+        with self.assertRaises(TypeError):
+            fips.counties.Counties.match(FIPS="06001")
+        self.assertTrue(data.where(data.notna()).equals(data))
+
+    def test_counties_state(self):
+        data = fips.counties.Counties()
+        test = fips.counties.Counties(state="CA")
+        self.assertEqual(test.FIPS.tolist(),data.FIPS[data.ST == "CA"].tolist())
+        self.assertEqual(test.index.tolist(),list(range(len(test))))
+        test = fips.counties.Counties(state=["WY","CA"])
+        self.assertEqual(test.ST.unique().tolist(),["WY","CA"])
+        self.assertEqual(len(test),(data.ST == "WY").sum()+(data.ST == "CA").sum())
+        with self.assertRaises(KeyError):
+            fips.counties.Counties(state="ZZ")
+
+    def test_counties_cache(self):
+        counties = fips.counties.Counties
+        counties.set_cache(2)
+        try:
+            counties.cache_clear()
+            first = counties(state="CA",use_index="COUNTY")
+            second = counties(state=["CA"],use_index="COUNTY")
+            self.assertEqual(tuple(counties.cache_info()),(1,1,2,1))
+            self.assertIsInstance(second,counties)
+            self.assertTrue(second.equals(first))
+            second.loc["Alameda","LAT"] = 0.0
+            self.assertEqual(counties(state="CA",use_index="COUNTY").loc["Alameda","LAT"],37.647139)
+            self.assertEqual(counties(use_index=["ST"]).index.nlevels,1)
+            self.assertEqual(counties(use_index="ST").index.nlevels,1)
+            self.assertEqual(tuple(counties.cache_info()),(2,3,2,2))
+            counties(state="CA",use_index="COUNTY")
+            self.assertEqual(counties.cache_info().misses,4)
+        finally:
+            counties.set_cache(0)
+            counties.cache_clear()
+
+class TestSpatial(unittest.TestCase):
+
+    def test_kdtree(self):
+        rng = np.random.default_rng(0)
+        points = rng.normal(size=(500,3))
+        queries = rng.normal(size=(200,3))
+        dist,index = fips.spatial.KDTree(points,leafsize=8).query(queries,k=3)
+        brute = np.sqrt(((queries[:,None,:]-points[None,:,:])**2).sum(axis=2))
+        self.assertTrue((np.argsort(brute,axis=1)[:,:3] == index).all())
+        self.assertTrue(np.allclose(np.sort(brute,axis=1)[:,:3],dist))
+        queries,index,dist = fips.spatial.KDTree(points,leafsize=8).query_radius(queries,1.0)
+        self.assertEqual(list(zip(queries,index)),list(zip(*np.nonzero(brute <= 1.0))))
+        self.assertTrue(np.allclose(dist,brute[queries,index]))
+
+class TestGeohash(unittest.TestCase):
+
+    def test_geohash_counties(self):
+        data = fips.counties.Counties()
+        self.assertTrue((fips.geohash.encode(data.LAT,data.LON,6) == data.GEOHASH).all())
+        lat,lon,lat_error,lon_error = fips.geohash.decode(data.GEOHASH,errors=True)
+        self.assertTrue((abs(lat-data.LAT) <= lat_error).all())
+        self.assertTrue((abs(lon-data.LON) <= lon_error).all())
+
+    def test_geohash_decode(self):
+        lat,lon = fips.geohash.decode(["u4pruydqqvj","9Q","s"])
+        self.assertTrue(np.allclose(lat,[57.64911063,36.5625,22.5]))
+        self.assertTrue(np.allclose(lon,[10.40743969,-118.125,22.5]))
+        for precision in range(1,13):
+            geohash = fips.geohash.encode(lat,lon,precision)
+            self.assertTrue((fips.geohash.encode(*fips.geohash.decode(geohash),precision) == geohash).all())
+        with self.assertRaises(ValueError):
+            fips.geohash.decode("9qa")
+        self.assertEqual(fips.geohash.encode([37.65,np.nan,np.inf],[-121.91,0.0,0.0],3).tolist(),
+            ["9q9","",""])
+        lat,lon = fips.geohash.decode(["","9q9"])
+        self.assertTrue(np.isnan(lat[0]) and np.isnan(lon[0]))
+        self.assertFalse(np.isnan(lat[1]) or np.isnan(lon[1]))
+
+class TestSparse(unittest.TestCase):
+
+    def test_sparse_matmul(self):
+        matrix = fips.sparse.CSRMatrix.from_coo([0,0,2,0],[0,1,2,0],[1.0,0.5,2.0,1.0],(3,4))
+        expected = np.array([[2.0,0.5,0,0],[0,0,0,0],[0,0,2.0,0]])
+        self.assertTrue((matrix.toarray() == expected).all())
+        values = np.arange(8.0).reshape(4,2)
+        self.assertTrue(np.allclose(matrix @ values,expected @ values))
+        self.assertTrue(np.allclose(matrix @ values[:,0],expected @ values[:,0]))
+        with self.assertRaises(ValueError):
+            _ = matrix @ values[1:]
+
+class TestLocaltime(unittest.TestCase):
+
+    def test_localtime_transitions(self):
+        self.assertEqual(fips.localtime.transitions(2025),
+            (np.datetime64("2025-03-09T02:00"),np.datetime64("2025-11-02T01:00")))
+        self.assertEqual(fips.localtime.transitions(1990),
+            (np.datetime64("1990-04-01T02:00"),np.datetime64("1990-10-28T01:00")))
+
+    def test_localtime_zoneinfo(self):
+        utc = np.arange(np.datetime64("1970-01-01T00:30"),np.datetime64("2031-01-01"),
+            np.timedelta64(30,"m"))[::997]
+        zone = zoneinfo.ZoneInfo("America/New_York")
+        expected = [dt.datetime.fromisoformat(str(x)).replace(tzinfo=dt.timezone.utc)
+            .astimezone(zone).utcoffset().total_seconds()/3600 for x in utc]
+        self.assertEqual(fips.localtime.utc_offset(utc,-5,1).tolist(),expected)
+
+class TestImport(unittest.TestCase):
+
+    IMPORT_BUDGET = 0.25
+    """Maximum seconds to import the package and look up a state and county"""
+
+    def test_import_lazy(self):
+        result = subprocess.run([sys.executable,"-c","""if True:
+            import sys, time
+            tic = time.perf_counter()
+            import fips
+            fips.State(ST="CA").FIPS
+            fips.County(ST="CA",COUNTY="Alameda").GEOHASH
+            fips.counties.County.from_fips("06001").to_dict()
+            print(time.perf_counter()-tic)
+            print("pandas" in sys.modules or "numpy" in sys.modules)
+            """],capture_output=True,text=True,check=True)
+        elapsed,loaded = result.stdout.split()
+        self.assertEqual(loaded,"False")
+        self.assertLess(float(elapsed),self.IMPORT_BUDGET)
+
 if __name__ == "__main__":
     unittest.main()